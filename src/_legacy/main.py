@@ -12,6 +12,26 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 PROCESSED_DIR = BASE_DIR / "data" / "processed"
 
 
+@st.cache_data(show_spinner=False, ttl=None)
+def load_data_cached(processed_dir_str: str, mtime: float):
+    """Cached wrapper around load_data, keyed on directory path + mtime.
+
+    mtime must NOT be underscore-prefixed: Streamlit excludes underscored
+    parameters from the cache key, which would pin stale data for the life
+    of the process. As a plain float it participates in the hash, so the
+    cache invalidates when files change on disk; otherwise reruns reuse
+    the already-parsed objects instead of re-reading every JSON.
+
+    Returns (incident_ids, by_id, metrics). The loader already sorts by
+    incident_id, so the cached id list and id -> incident index replace all
+    per-rerun scans over the incident list.
+    """
+    incidents, metrics = load_data(Path(processed_dir_str))
+    incident_ids = [i['incident_id'] for i in incidents]
+    by_id = {i['incident_id']: i for i in incidents}
+    return incident_ids, by_id, metrics
+
+
 def render_incident_details(incident):
     title = incident.get('title', incident.get('description', 'No description')[:50])
     st.subheader(f"{incident['incident_id']}: {title}")
@@ -56,11 +76,11 @@ def render_incident_details(incident):
 def main():
     st.title("🛡️ Bowtie Risk Analytics")
 
-    # Load Data
-    with st.spinner("Loading data..."):
-        incidents, metrics = load_data(PROCESSED_DIR)
+    # Load Data (cached — returns instantly on rerun)
+    mtime = PROCESSED_DIR.stat().st_mtime if PROCESSED_DIR.exists() else 0.0
+    incident_ids, by_id, metrics = load_data_cached(str(PROCESSED_DIR), mtime)
 
-    st.sidebar.success(f"Loaded {len(incidents)} incidents")
+    st.sidebar.success(f"Loaded {len(incident_ids)} incidents")
 
     # KPIs
     col1, col2, col3, col4 = st.columns(4)
@@ -74,25 +94,25 @@ def main():
     # Incident Explorer
     st.header("Incident Explorer")
 
-    if not incidents:
+    if not incident_ids:
         st.warning("No incidents found.")
         return
 
-    # Selection
+    # Selection (dict lookups instead of O(N) scans per dropdown entry)
     def format_incident(incident_id):
-        for i in incidents:
-            if i['incident_id'] == incident_id:
-                title = i.get('title', i.get('description', '')[:40])
-                return f"{incident_id} - {title}"
-        return incident_id
+        incident = by_id.get(incident_id)
+        if incident is None:
+            return incident_id
+        title = incident.get('title', incident.get('description', '')[:40])
+        return f"{incident_id} - {title}"
 
     selected_id = st.selectbox(
         "Select Incident",
-        options=[i['incident_id'] for i in incidents],
+        options=incident_ids,
         format_func=format_incident
     )
 
-    selected_incident = next((i for i in incidents if i['incident_id'] == selected_id), None)
+    selected_incident = by_id.get(selected_id)
 
     if selected_incident:
         render_incident_details(selected_incident)
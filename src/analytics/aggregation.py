@@ -2,6 +2,48 @@
 from typing import List, Dict, Any
 import statistics
 
+class FleetAccumulator:
+    """Streaming accumulator for fleet-wide coverage metrics.
+
+    Produces the same output as calculate_fleet_metrics without holding
+    every incident dict in memory: callers feed dicts one at a time and
+    only running sums are kept.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._prev_sum = 0.0
+        self._mit_sum = 0.0
+        self._overall_sum = 0.0
+
+    def update(self, incident_data: Dict[str, Any]) -> None:
+        """Fold one processed incident dict into the running totals."""
+        self.update_coverage(incident_data.get("analytics", {}).get("coverage", {}))
+
+    def update_coverage(self, coverage: Dict[str, float]) -> None:
+        """Fold one incident's coverage dict (possibly empty) into the totals."""
+        self.count += 1
+        self._prev_sum += coverage.get("prevention_coverage", 0.0)
+        self._mit_sum += coverage.get("mitigation_coverage", 0.0)
+        self._overall_sum += coverage.get("overall_coverage", 0.0)
+
+    def finalize(self) -> Dict[str, float]:
+        """Return the aggregate metrics for everything seen so far."""
+        if not self.count:
+            return {
+                "total_incidents": 0,
+                "average_prevention_coverage": 0.0,
+                "average_mitigation_coverage": 0.0,
+                "average_overall_coverage": 0.0
+            }
+        return {
+            "total_incidents": self.count,
+            "average_prevention_coverage": self._prev_sum / self.count,
+            "average_mitigation_coverage": self._mit_sum / self.count,
+            "average_overall_coverage": self._overall_sum / self.count
+        }
+
+
 def calculate_fleet_metrics(incidents_data: List[Dict[str, Any]]) -> Dict[str, float]:
     """
     Calculates aggregate metrics across a list of processed incidents.
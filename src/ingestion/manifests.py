@@ -1,14 +1,135 @@
 """Manifest models for tracking incident acquisition and text extraction."""
 import csv
 import logging
+import pickle
 from datetime import datetime
 from pathlib import Path
 from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 logger = logging.getLogger(__name__)
 
+# Truthy tokens for boolean CSV cells; membership test avoids allocating a
+# lowercased copy of every cell.
+_TRUE_TOKENS = frozenset({"true", "True", "TRUE", "1"})
+
+# Manifests above this size are parsed with pandas' pyarrow engine (SIMD CSV
+# reader); below it, engine startup overhead outweighs the parse.
+_PYARROW_MIN_BYTES = 64 * 1024
+
+
+def _read_csv_str(path: Path) -> pd.DataFrame:
+    """Read a CSV with every column as str and empty strings preserved."""
+    if path.stat().st_size > _PYARROW_MIN_BYTES:
+        try:
+            return pd.read_csv(
+                path, dtype=str, keep_default_na=False, engine="pyarrow"
+            )
+        except ImportError:  # pyarrow missing: fall through to the C engine
+            pass
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def _read_manifest_records(
+    path: Path,
+    bool_cols: tuple[str, ...] = (),
+    int_cols: tuple[str, ...] = (),
+    datetime_cols: tuple[str, ...] = (),
+    optional_str_cols: tuple[str, ...] = (),
+) -> list[dict]:
+    """Read a manifest CSV into record dicts with vectorized column coercion.
+
+    pandas does the bool/int/datetime conversions in C column scans instead
+    of a per-row Python if/elif ladder; empty strings in optional columns
+    become None.
+
+    Callers guard missing files with is_file() before calling, so only an
+    empty file needs handling here.
+    """
+    try:
+        df = _read_csv_str(path)
+    except pd.errors.EmptyDataError:
+        return []
+
+    for col in bool_cols:
+        if col in df.columns:
+            df[col] = df[col].isin(_TRUE_TOKENS)
+    for col in int_cols:
+        if col in df.columns:
+            s = pd.to_numeric(df[col].where(df[col] != "", None)).astype("Int64")
+            df[col] = s.astype(object).where(s.notna(), None)
+    for col in datetime_cols:
+        if col in df.columns:
+            s = pd.to_datetime(
+                df[col].where(df[col] != "", None), format="ISO8601"
+            )
+            df[col] = s.astype(object).where(s.notna(), None)
+    for col in optional_str_cols:
+        if col in df.columns:
+            cleared = df[col].astype(object)
+            cleared[cleared == ""] = None
+            df[col] = cleared
+
+    return df.to_dict(orient="records")
+
+
+def _write_csv_rows(
+    path: Path, fieldnames: tuple[str, ...], dicts: list[dict]
+) -> None:
+    """Write record dicts to CSV as column-ordered tuples.
+
+    csv.writer with prebuilt tuples skips DictWriter's per-cell dict lookup
+    and missing-key checks; the 1 MiB buffer batches writes into few
+    syscalls on large manifests. Writing to a sibling tmp file and renaming
+    keeps a crashed run from truncating the manifest in place.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            tuple("" if d.get(k) is None else d[k] for k in fieldnames)
+            for d in dicts
+        )
+    tmp.replace(path)
+
+
+def _cache_path(path: Path) -> Path:
+    """Sibling pickle snapshot for a manifest CSV."""
+    return path.with_name(path.name + ".cache.pkl")
+
+
+def _load_cached_rows(path: Path) -> Optional[list]:
+    """Return pickled rows for *path* if the snapshot is newer than the CSV.
+
+    Re-parsing a large manifest CSV (and rebuilding its Pydantic rows) on
+    every --append run is pure CPU; the pickle written at save time loads
+    in one pass. Any staleness or unpickling problem falls back to the CSV.
+    """
+    cache = _cache_path(path)
+    try:
+        if cache.stat().st_mtime_ns > path.stat().st_mtime_ns:
+            with open(cache, "rb") as f:
+                return pickle.load(f)
+    except Exception as e:  # stale class layout, truncated file, missing cache
+        logger.debug(f"Manifest cache unusable for {path}: {e}")
+    return None
+
+
+def _write_cached_rows(path: Path, rows: list) -> None:
+    """Write the pickle snapshot for *path*; written after the CSV so its
+    mtime marks it current. Best-effort — failures never break the save."""
+    cache = _cache_path(path)
+    tmp = cache.with_name(cache.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache)
+    except OSError as e:
+        logger.debug(f"Could not write manifest cache for {path}: {e}")
+
 
 class IncidentManifestRow(BaseModel):
     """Row in incidents_manifest_v0.csv (download tracking)."""
@@ -32,6 +153,20 @@ class IncidentManifestRow(BaseModel):
     error: Optional[str] = None
 
 
+def patch_incident_row(
+    row: IncidentManifestRow, **updates: object
+) -> IncidentManifestRow:
+    """Return a copy of *row* with fields replaced, skipping re-validation.
+
+    Download/state updates come from trusted code (status codes, digests,
+    timestamps we just produced), so model_construct avoids the copy +
+    validation cost of model_copy on every branch of the download loops.
+    """
+    d = dict(row.__dict__)
+    d.update(updates)
+    return IncidentManifestRow.model_construct(**d)
+
+
 class TextManifestRow(BaseModel):
     """Row in text_manifest_v0.csv (extraction tracking)."""
 
@@ -50,123 +185,99 @@ class TextManifestRow(BaseModel):
     error: Optional[str] = None
 
 
-def load_incident_manifest(path: Path) -> list[IncidentManifestRow]:
-    """Load incident manifest from CSV file."""
-    if not path.exists():
-        logger.warning(f"Manifest not found: {path}")
-        return []
+# Column orders for the CSV writers, computed once at import instead of per
+# save call.
+_INCIDENT_FIELDS = tuple(IncidentManifestRow.model_fields.keys())
+_TEXT_FIELDS = tuple(TextManifestRow.model_fields.keys())
 
-    rows = []
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row_dict in reader:
-            # Convert string booleans
-            if "downloaded" in row_dict:
-                row_dict["downloaded"] = row_dict["downloaded"].lower() == "true"
-            # Convert empty strings to None for optional int fields
-            for key in ["http_status", "file_size_bytes"]:
-                if key in row_dict and row_dict[key] == "":
-                    row_dict[key] = None
-                elif key in row_dict and row_dict[key]:
-                    row_dict[key] = int(row_dict[key])
-            # Parse datetime
-            if "retrieved_at" in row_dict and row_dict["retrieved_at"]:
-                row_dict["retrieved_at"] = datetime.fromisoformat(
-                    row_dict["retrieved_at"]
-                )
-            elif "retrieved_at" in row_dict:
-                row_dict["retrieved_at"] = None
-            # Handle empty optional strings
-            for key in [
-                "date_occurred",
-                "date_report_released",
-                "content_type",
-                "sha256",
-                "error",
-            ]:
-                if key in row_dict and row_dict[key] == "":
-                    row_dict[key] = None
+# List adapters serialize a whole manifest in one pydantic-core call
+# instead of a per-row model_dump loop.
+_INCIDENT_LIST = TypeAdapter(list[IncidentManifestRow])
+_TEXT_LIST = TypeAdapter(list[TextManifestRow])
 
-            rows.append(IncidentManifestRow(**row_dict))
-    return rows
+
+def load_incident_manifest(
+    path: Path, validate: bool = False
+) -> list[IncidentManifestRow]:
+    """Load incident manifest from CSV file.
+
+    Manifests are round-tripped through save_incident_manifest, so rows are
+    built with model_construct by default, skipping re-validation of data we
+    wrote ourselves. Pass validate=True for externally produced CSVs.
+    """
+    # is_file (not exists) so a same-named directory also reads as empty
+    if not path.is_file():
+        logger.warning(f"Manifest not found: {path}")
+        return []
+    if not validate:
+        cached = _load_cached_rows(path)
+        if cached is not None:
+            return cached
+    records = _read_manifest_records(
+        path,
+        bool_cols=("downloaded",),
+        int_cols=("http_status", "file_size_bytes"),
+        datetime_cols=("retrieved_at",),
+        optional_str_cols=(
+            "date_occurred",
+            "date_report_released",
+            "content_type",
+            "sha256",
+            "error",
+        ),
+    )
+    if validate:
+        return [IncidentManifestRow(**rec) for rec in records]
+    return [IncidentManifestRow.model_construct(**rec) for rec in records]
 
 
 def save_incident_manifest(rows: list[IncidentManifestRow], path: Path) -> None:
     """Save incident manifest to CSV file."""
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    fieldnames = list(IncidentManifestRow.model_fields.keys())
+    # mode="json" already emits ISO strings for datetimes, so the only
+    # remaining coercion is None -> "" for the CSV cells.
+    dicts = _INCIDENT_LIST.dump_python(rows, mode="json")
 
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            row_dict = row.model_dump()
-            # Convert datetime to ISO string
-            if row_dict["retrieved_at"]:
-                row_dict["retrieved_at"] = row_dict["retrieved_at"].isoformat()
-            # Convert None to empty string
-            row_dict = {k: ("" if v is None else v) for k, v in row_dict.items()}
-            # Convert bool to string
-            row_dict["downloaded"] = str(row_dict["downloaded"])
-            writer.writerow(row_dict)
+    _write_csv_rows(path, _INCIDENT_FIELDS, dicts)
+    _write_cached_rows(path, rows)
 
 
-def load_text_manifest(path: Path) -> list[TextManifestRow]:
-    """Load text manifest from CSV file."""
-    if not path.exists():
+def load_text_manifest(
+    path: Path, validate: bool = False
+) -> list[TextManifestRow]:
+    """Load text manifest from CSV file.
+
+    Like load_incident_manifest, trusted round-trip loads skip Pydantic
+    validation via model_construct unless validate=True is passed.
+    """
+    if not path.is_file():
         logger.warning(f"Manifest not found: {path}")
         return []
-
-    rows = []
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row_dict in reader:
-            # Convert string booleans
-            for key in ["extracted", "is_empty"]:
-                if key in row_dict:
-                    row_dict[key] = row_dict[key].lower() == "true"
-            # Convert empty strings to None for optional int fields
-            for key in ["page_count", "char_count"]:
-                if key in row_dict and row_dict[key] == "":
-                    row_dict[key] = None
-                elif key in row_dict and row_dict[key]:
-                    row_dict[key] = int(row_dict[key])
-            # Parse datetime
-            if "extracted_at" in row_dict and row_dict["extracted_at"]:
-                row_dict["extracted_at"] = datetime.fromisoformat(
-                    row_dict["extracted_at"]
-                )
-            elif "extracted_at" in row_dict:
-                row_dict["extracted_at"] = None
-            # Handle empty optional strings
-            if "error" in row_dict and row_dict["error"] == "":
-                row_dict["error"] = None
-
-            rows.append(TextManifestRow(**row_dict))
-    return rows
+    if not validate:
+        cached = _load_cached_rows(path)
+        if cached is not None:
+            return cached
+    records = _read_manifest_records(
+        path,
+        bool_cols=("extracted", "is_empty"),
+        int_cols=("page_count", "char_count"),
+        datetime_cols=("extracted_at",),
+        optional_str_cols=("error",),
+    )
+    if validate:
+        return [TextManifestRow(**rec) for rec in records]
+    return [TextManifestRow.model_construct(**rec) for rec in records]
 
 
 def save_text_manifest(rows: list[TextManifestRow], path: Path) -> None:
     """Save text manifest to CSV file."""
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    fieldnames = list(TextManifestRow.model_fields.keys())
+    dicts = _TEXT_LIST.dump_python(rows, mode="json")
 
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            row_dict = row.model_dump()
-            # Convert datetime to ISO string
-            if row_dict["extracted_at"]:
-                row_dict["extracted_at"] = row_dict["extracted_at"].isoformat()
-            # Convert None to empty string
-            row_dict = {k: ("" if v is None else v) for k, v in row_dict.items()}
-            # Convert bools to string
-            row_dict["extracted"] = str(row_dict["extracted"])
-            row_dict["is_empty"] = str(row_dict["is_empty"])
-            writer.writerow(row_dict)
+    _write_csv_rows(path, _TEXT_FIELDS, dicts)
+    _write_cached_rows(path, rows)
 
 
 class SourceManifestRow(BaseModel):
@@ -226,103 +337,59 @@ def save_source_manifest(rows: list[SourceManifestRow], path: Path) -> None:
             writer.writerow(row_dict)
 
 
-def _get_merge_key(row: IncidentManifestRow) -> tuple[str, str]:
+def _get_merge_key(row_dict: dict) -> tuple[str, str]:
     """
     Get the merge key for deduplication.
 
     Key is (source, pdf_url), or fallback to (source, incident_id) if pdf_url is empty.
     """
-    if row.pdf_url:
-        return (row.source, row.pdf_url)
-    return (row.source, row.incident_id)
+    if row_dict["pdf_url"]:
+        return (row_dict["source"], row_dict["pdf_url"])
+    return (row_dict["source"], row_dict["incident_id"])
 
 
-def _compare_rows(a: IncidentManifestRow, b: IncidentManifestRow) -> int:
+def _priority(row_dict: dict) -> tuple:
     """
-    Compare two rows to determine winner.
+    Sortable priority key encoding the conflict-resolution rules:
 
-    Returns:
-        -1 if a wins, 1 if b wins, 0 if tie.
-
-    Priority rules:
     1. downloaded=True beats downloaded=False
-    2. retrieved_at newer beats older
+    2. retrieved_at newer beats older (present beats missing)
     3. sha256 present beats missing
-    4. file_size_bytes larger beats smaller
-    5. otherwise tie (existing wins)
-    """
-    # Rule 1: downloaded=True beats False
-    if a.downloaded and not b.downloaded:
-        return -1
-    if b.downloaded and not a.downloaded:
-        return 1
-
-    # Rule 2: newer retrieved_at beats older
-    if a.retrieved_at and b.retrieved_at:
-        if a.retrieved_at > b.retrieved_at:
-            return -1
-        if b.retrieved_at > a.retrieved_at:
-            return 1
-    elif a.retrieved_at and not b.retrieved_at:
-        return -1
-    elif b.retrieved_at and not a.retrieved_at:
-        return 1
-
-    # Rule 3: sha256 present beats missing
-    if a.sha256 and not b.sha256:
-        return -1
-    if b.sha256 and not a.sha256:
-        return 1
-
-    # Rule 4: larger file_size_bytes beats smaller
-    if a.file_size_bytes is not None and b.file_size_bytes is not None:
-        if a.file_size_bytes > b.file_size_bytes:
-            return -1
-        if b.file_size_bytes > a.file_size_bytes:
-            return 1
-    elif a.file_size_bytes is not None and b.file_size_bytes is None:
-        return -1
-    elif b.file_size_bytes is not None and a.file_size_bytes is None:
-        return 1
-
-    # Rule 5: tie
-    return 0
-
-
-def _enrich_winner(
-    winner: IncidentManifestRow, loser: IncidentManifestRow
-) -> IncidentManifestRow:
-    """
-    Enrich winner with missing descriptive fields from loser.
-
-    Descriptive fields that can be enriched:
-    - title, date_occurred, date_report_released, detail_url, pdf_path
+    4. file_size_bytes larger beats smaller (present beats missing)
 
-    State fields are NOT enriched (kept strictly from winner):
-    - downloaded, retrieved_at, http_status, content_type, file_size_bytes, sha256, error
+    Each rule becomes one tuple element, so picking a winner is a single
+    lexicographic comparison instead of a chain of branches. The explicit
+    presence flag before retrieved_at keeps None rows comparable without
+    mixing a sentinel datetime into real timestamps.
     """
-    updates = {}
-
-    # Enrich missing title
-    if not winner.title and loser.title:
-        updates["title"] = loser.title
-
-    # Enrich missing dates
-    if not winner.date_occurred and loser.date_occurred:
-        updates["date_occurred"] = loser.date_occurred
-    if not winner.date_report_released and loser.date_report_released:
-        updates["date_report_released"] = loser.date_report_released
-
-    # Enrich missing detail_url
-    if not winner.detail_url and loser.detail_url:
-        updates["detail_url"] = loser.detail_url
-
-    # Enrich missing pdf_path
-    if not winner.pdf_path and loser.pdf_path:
-        updates["pdf_path"] = loser.pdf_path
-
-    if updates:
-        return winner.model_copy(update=updates)
+    retrieved_at = row_dict["retrieved_at"]
+    file_size = row_dict["file_size_bytes"]
+    return (
+        row_dict["downloaded"],
+        retrieved_at is not None,
+        retrieved_at or datetime.min,
+        bool(row_dict["sha256"]),
+        file_size if file_size is not None else -1,
+    )
+
+
+# Descriptive fields a winner may inherit from the loser when missing.
+# State fields (downloaded, retrieved_at, http_status, content_type,
+# file_size_bytes, sha256, error) are kept strictly from the winner.
+_ENRICHABLE_FIELDS = (
+    "title",
+    "date_occurred",
+    "date_report_released",
+    "detail_url",
+    "pdf_path",
+)
+
+
+def _enrich_winner(winner: dict, loser: dict) -> dict:
+    """Fill the winner's missing descriptive fields from the loser, in place."""
+    for field in _ENRICHABLE_FIELDS:
+        if not winner[field] and loser[field]:
+            winner[field] = loser[field]
     return winner
 
 
@@ -351,28 +418,53 @@ def merge_incident_manifests(
     Returns:
         Merged and deduplicated list of rows.
     """
-    # Build index of existing rows by key
-    by_key: dict[tuple[str, str], IncidentManifestRow] = {}
+    # The merge works on plain dicts: dict access and in-place enrichment are
+    # far cheaper than Pydantic model_copy on every collision. Models are
+    # materialized once at the end via model_construct.
+    by_key: dict[tuple[str, str], dict] = {}
 
     for row in existing:
-        key = _get_merge_key(row)
-        by_key[key] = row
+        row_dict = row.model_dump()
+        by_key[_get_merge_key(row_dict)] = row_dict
 
     # Merge new rows
     for row in new:
-        key = _get_merge_key(row)
+        row_dict = row.model_dump()
+        key = _get_merge_key(row_dict)
 
         if key in by_key:
-            existing_row = by_key[key]
-            comparison = _compare_rows(existing_row, row)
-
-            if comparison <= 0:
-                # Existing wins or tie - enrich existing from new
-                by_key[key] = _enrich_winner(existing_row, row)
+            existing_dict = by_key[key]
+            # Existing wins on tie
+            if _priority(existing_dict) >= _priority(row_dict):
+                winner, loser = existing_dict, row_dict
             else:
-                # New wins - enrich new from existing
-                by_key[key] = _enrich_winner(row, existing_row)
+                winner, loser = row_dict, existing_dict
+            by_key[key] = _enrich_winner(winner, loser)
         else:
-            by_key[key] = row
+            by_key[key] = row_dict
+
+    return [
+        IncidentManifestRow.model_construct(**d) for d in by_key.values()
+    ]
+
 
-    return list(by_key.values())
+def update_incident_manifest(
+    path: Path, new_rows: list[IncidentManifestRow]
+) -> list[IncidentManifestRow]:
+    """Merge new rows into the manifest at *path* and rewrite it.
+
+    Fuses the load -> merge -> save round-trip behind one call: the load
+    is usually a single unpickle of the sidecar cache, the merge is one
+    dict upsert, and the rewrite lands atomically via the tmp-and-rename
+    in _write_csv_rows.
+
+    Returns:
+        The merged rows as written.
+    """
+    existing = load_incident_manifest(path) if path.is_file() else []
+    if existing:
+        merged = merge_incident_manifests(existing, new_rows)
+    else:
+        merged = list(new_rows)
+    save_incident_manifest(merged, path)
+    return merged
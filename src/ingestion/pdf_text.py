@@ -1,10 +1,24 @@
-"""PDF text extraction using pdfplumber."""
+"""PDF text extraction using PyMuPDF (pdfplumber fallback)."""
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 
-import pdfplumber
+# PyMuPDF's C-based extraction is an order of magnitude faster than
+# pdfplumber's pure-Python layout analysis and releases the GIL; fall back
+# to pdfplumber where PyMuPDF is not installed.
+try:
+    import fitz
+
+    PDF_EXTRACTOR = "pymupdf"
+except ImportError:
+    fitz = None
+    import pdfplumber
+
+    PDF_EXTRACTOR = "pdfplumber"
 
 from src.ingestion.manifests import TextManifestRow, IncidentManifestRow
 
@@ -23,7 +37,11 @@ def extract_text_from_pdf(
         text_path: Path to output text file.
 
     Returns:
-        Tuple of (text_content, page_count, char_count, error_or_none)
+        Tuple of ("", page_count, char_count, error_or_none).
+
+        The first element is always an empty string: pages are streamed
+        directly to ``text_path`` instead of being materialized in memory,
+        so callers should read the text file if they need the content.
     """
     if not pdf_path.exists():
         return "", 0, 0, "PDF not found"
@@ -32,30 +50,67 @@ def extract_text_from_pdf(
     text_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            page_count = len(pdf.pages)
-            pages_text = []
+        if fitz is not None:
+            return _extract_pymupdf(pdf_path, text_path)
+        return _extract_pdfplumber(pdf_path, text_path)
+    except Exception as e:
+        logger.warning(f"Failed to extract text from {pdf_path}: {e}")
+        return "", 0, 0, str(e)
 
-            for i, page in enumerate(pdf.pages):
+
+def _extract_pymupdf(
+    pdf_path: Path, text_path: Path
+) -> tuple[str, int, int, Optional[str]]:
+    """Stream page text to text_path using PyMuPDF."""
+    doc = fitz.open(str(pdf_path))
+    try:
+        with text_path.open("w", encoding="utf-8") as out:
+            page_count = len(doc)
+            char_count = 0
+
+            for i, page in enumerate(doc):
                 try:
-                    text = page.extract_text() or ""
-                    # Strip trailing whitespace per page
-                    pages_text.append(text.rstrip())
+                    text = page.get_text().rstrip()
                 except Exception as e:
                     logger.warning(f"Page {i + 1} extraction failed: {e}")
-                    pages_text.append("")
+                    text = ""
 
-            full_text = "\n\n".join(pages_text)
-            char_count = len(full_text)
+                # Stream each page to disk; pages separated by blank lines
+                if i > 0:
+                    out.write("\n\n")
+                    char_count += 2
+                out.write(text)
+                char_count += len(text)
+    finally:
+        doc.close()
 
-            # Write to text file
-            text_path.write_text(full_text, encoding="utf-8")
+    return "", page_count, char_count, None
 
-            return full_text, page_count, char_count, None
 
-    except Exception as e:
-        logger.warning(f"Failed to extract text from {pdf_path}: {e}")
-        return "", 0, 0, str(e)
+def _extract_pdfplumber(
+    pdf_path: Path, text_path: Path
+) -> tuple[str, int, int, Optional[str]]:
+    """Stream page text to text_path using pdfplumber (fallback path)."""
+    with pdfplumber.open(pdf_path) as pdf, \
+            text_path.open("w", encoding="utf-8") as out:
+        page_count = len(pdf.pages)
+        char_count = 0
+
+        for i, page in enumerate(pdf.pages):
+            try:
+                text = (page.extract_text() or "").rstrip()
+            except Exception as e:
+                logger.warning(f"Page {i + 1} extraction failed: {e}")
+                text = ""
+
+            # Stream each page to disk; pages separated by blank lines
+            if i > 0:
+                out.write("\n\n")
+                char_count += 2
+            out.write(text)
+            char_count += len(text)
+
+        return "", page_count, char_count, None
 
 
 def _compute_text_path(pdf_path_str: str) -> str:
@@ -64,23 +119,43 @@ def _compute_text_path(pdf_path_str: str) -> str:
 
     Example: csb/pdfs/report.pdf -> csb/text/report.txt
     """
-    # Normalize to forward slashes for consistency
-    normalized = pdf_path_str.replace("\\", "/")
-    parts = normalized.split("/")
-
-    # Find and replace 'pdfs' with 'text'
-    for i, part in enumerate(parts):
-        if part == "pdfs":
-            parts[i] = "text"
-            break
-
-    # Change extension
-    result = "/".join(parts)
+    # Normalize to forward slashes, then swap the first pdfs/ component and
+    # the extension in single C-level string passes (no split/join).
+    result = pdf_path_str.replace("\\", "/")
+    if result.startswith("pdfs/"):
+        result = "text/" + result[len("pdfs/"):]
+    else:
+        result = result.replace("/pdfs/", "/text/", 1)
     if result.endswith(".pdf"):
         result = result[:-4] + ".txt"
     return result
 
 
+def _extract_one(
+    row: IncidentManifestRow, base_dir: Path
+) -> TextManifestRow:
+    """Extract text for one downloaded PDF (worker for the process pool)."""
+    pdf_path = base_dir / row.pdf_path
+    text_rel_path = _compute_text_path(row.pdf_path)
+    text_path = base_dir / text_rel_path
+
+    _, page_count, char_count, error = extract_text_from_pdf(pdf_path, text_path)
+
+    return TextManifestRow(
+        source=row.source,
+        incident_id=row.incident_id,
+        pdf_path=row.pdf_path,
+        text_path=text_rel_path,
+        extracted=(error is None),
+        extracted_at=datetime.now(timezone.utc),
+        extractor=PDF_EXTRACTOR,
+        page_count=page_count,
+        char_count=char_count,
+        is_empty=(char_count == 0),
+        error=error,
+    )
+
+
 def process_incident_manifest(
     incident_manifest: list[IncidentManifestRow],
     base_dir: Path,
@@ -88,45 +163,42 @@ def process_incident_manifest(
     """
     Process all downloaded PDFs from incident manifest.
 
+    Extraction fans out across a process pool: pdfplumber parsing is
+    CPU-bound, so processes (not threads) let it use every core.
+
     Args:
         incident_manifest: List of incident manifest rows.
         base_dir: Base directory for PDF and text files.
 
     Returns:
-        List of text manifest rows.
+        List of text manifest rows (manifest order preserved).
     """
-    text_rows = []
-
-    for row in incident_manifest:
-        if not row.downloaded:
-            continue
-
-        pdf_path = base_dir / row.pdf_path
-        text_rel_path = _compute_text_path(row.pdf_path)
-        text_path = base_dir / text_rel_path
-
-        _, page_count, char_count, error = extract_text_from_pdf(pdf_path, text_path)
-
-        text_row = TextManifestRow(
-            source=row.source,
-            incident_id=row.incident_id,
-            pdf_path=row.pdf_path,
-            text_path=text_rel_path,
-            extracted=(error is None),
-            extracted_at=datetime.now(timezone.utc),
-            extractor="pdfplumber",
-            page_count=page_count,
-            char_count=char_count,
-            is_empty=(char_count == 0),
-            error=error,
-        )
-        text_rows.append(text_row)
-
-        if error:
-            logger.warning(f"{row.incident_id}: extraction failed - {error}")
-        elif char_count == 0:
-            logger.warning(f"{row.incident_id}: extracted 0 chars (scanned PDF?)")
+    downloaded = [row for row in incident_manifest if row.downloaded]
+    if not downloaded:
+        return []
+
+    max_workers = min(os.cpu_count() or 1, len(downloaded))
+    if max_workers == 1:
+        text_rows = [_extract_one(row, base_dir) for row in downloaded]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            text_rows = list(
+                executor.map(_extract_one, downloaded, repeat(base_dir))
+            )
+
+    for text_row in text_rows:
+        if text_row.error:
+            logger.warning(
+                f"{text_row.incident_id}: extraction failed - {text_row.error}"
+            )
+        elif text_row.char_count == 0:
+            logger.warning(
+                f"{text_row.incident_id}: extracted 0 chars (scanned PDF?)"
+            )
         else:
-            logger.info(f"{row.incident_id}: {page_count} pages, {char_count} chars")
+            logger.info(
+                f"{text_row.incident_id}: {text_row.page_count} pages, "
+                f"{text_row.char_count} chars"
+            )
 
     return text_rows
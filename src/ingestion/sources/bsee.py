@@ -2,14 +2,17 @@
 import hashlib
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterator
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
-from src.ingestion.manifests import IncidentManifestRow
+from src.ingestion.manifests import IncidentManifestRow, patch_incident_row
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +28,42 @@ BSEE_PANEL_URL = (
 
 USER_AGENT = "BowtieRiskAnalytics/0.1 (academic research)"
 
+# Patterns compiled once at import; discovery hits these once per link, so
+# skipping re's per-call cache lookup adds up on large listing pages.
+_NONWORD_RE = re.compile(r"[^\w\s-]")
+_DASHSPACE_RE = re.compile(r"[-\s]+")
+_PDF_HREF_RE = re.compile(r'href="([^"]+\.pdf)"[^>]*>([^<]*)</a>', re.IGNORECASE)
+_YEAR_RE = re.compile(r"(\d{4})")
+
+
+def _make_session() -> requests.Session:
+    """Build a Session with a sized connection pool and retry policy.
+
+    Discovery and downloads reuse warm TCP/TLS connections instead of
+    re-handshaking per request; transient 429/5xx responses retry with
+    backoff.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def _slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
+    text = _NONWORD_RE.sub("", text)
+    text = _DASHSPACE_RE.sub("-", text)
     return text[:50]
 
 
@@ -52,8 +85,7 @@ def discover_bsee_incidents(limit: int = 20) -> Iterator[IncidentManifestRow]:
     Yields:
         IncidentManifestRow objects with downloaded=False.
     """
-    session = requests.Session()
-    session.headers["User-Agent"] = USER_AGENT
+    session = _make_session()
 
     count = 0
 
@@ -69,8 +101,7 @@ def discover_bsee_incidents(limit: int = 20) -> Iterator[IncidentManifestRow]:
         html = resp.text
 
         # Find PDF links in the page
-        pdf_pattern = r'href="([^"]+\.pdf)"[^>]*>([^<]*)</a>'
-        matches = re.findall(pdf_pattern, html, re.IGNORECASE)
+        matches = _PDF_HREF_RE.findall(html)
 
         seen_urls = set()
 
@@ -90,7 +121,7 @@ def discover_bsee_incidents(limit: int = 20) -> Iterator[IncidentManifestRow]:
             title = link_text.strip() if link_text.strip() else incident_id
 
             # Try to extract date from filename or link text
-            date_match = re.search(r"(\d{4})", pdf_url)
+            date_match = _YEAR_RE.search(pdf_url)
             date_occurred = f"{date_match.group(1)}-01-01" if date_match else None
 
             pdf_filename = pdf_url.split("/")[-1]
@@ -142,46 +173,85 @@ def download_bsee_pdf(
             }
 
             if resp.status_code != 200:
-                return row.model_copy(update={**updated, "downloaded": False})
+                return patch_incident_row(row, **updated, downloaded=False)
 
             # Validate PDF content type
             content_type = updated["content_type"].lower()
             is_pdf = "pdf" in content_type or row.pdf_url.lower().endswith(".pdf")
 
             if not is_pdf:
-                return row.model_copy(
-                    update={
-                        **updated,
-                        "downloaded": False,
-                        "error": f"Not a PDF: {content_type}",
-                    }
+                return patch_incident_row(
+                    row,
+                    **updated,
+                    downloaded=False,
+                    error=f"Not a PDF: {content_type}",
                 )
 
-            # Stream to disk with incremental hash
+            # Hash the 1 MiB chunks as they stream: the bytes are already
+            # in memory, so this avoids re-reading the finished file, and
+            # hashlib drops the GIL for updates this large.
             sha = hashlib.sha256()
-            size = 0
-
             with open(pdf_full_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
+                for chunk in resp.iter_content(chunk_size=1 << 20):
                     f.write(chunk)
                     sha.update(chunk)
-                    size += len(chunk)
-
-            return row.model_copy(
-                update={
-                    **updated,
-                    "downloaded": True,
-                    "file_size_bytes": size,
-                    "sha256": sha.hexdigest(),
-                }
+            sha256 = sha.hexdigest()
+
+            return patch_incident_row(
+                row,
+                **updated,
+                downloaded=True,
+                file_size_bytes=pdf_full_path.stat().st_size,
+                sha256=sha256,
             )
 
     except requests.RequestException as e:
         logger.warning(f"Failed to download {row.incident_id}: {e}")
-        return row.model_copy(
-            update={
-                "retrieved_at": datetime.now(timezone.utc),
-                "downloaded": False,
-                "error": str(e),
-            }
+        return patch_incident_row(
+            row,
+            retrieved_at=datetime.now(timezone.utc),
+            downloaded=False,
+            error=str(e),
         )
+
+
+def download_bsee_pdfs(
+    rows: list[IncidentManifestRow],
+    base_dir: Path,
+    timeout: int = 30,
+    concurrency: int = 8,
+) -> list[IncidentManifestRow]:
+    """
+    Download PDFs for many BSEE incidents concurrently.
+
+    The workload is network-bound, so rows fan out across a bounded thread
+    pool; each worker keeps its own requests.Session (keep-alive per
+    thread) so connections are reused without sharing a session across
+    threads.
+
+    Args:
+        rows: Incident manifest rows with pdf_url set.
+        base_dir: Base directory for downloads.
+        timeout: Per-request timeout in seconds.
+        concurrency: Max downloads in flight.
+
+    Returns:
+        Updated rows in input order.
+    """
+    if not rows:
+        return []
+
+    thread_local = threading.local()
+
+    def _session() -> requests.Session:
+        session = getattr(thread_local, "session", None)
+        if session is None:
+            session = _make_session()
+            thread_local.session = session
+        return session
+
+    def _download(row: IncidentManifestRow) -> IncidentManifestRow:
+        return download_bsee_pdf(row, base_dir, _session(), timeout=timeout)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(rows))) as executor:
+        return list(executor.map(_download, rows))
@@ -25,12 +25,21 @@ BSEE_PANEL_URL = (
 )
 USER_AGENT = "BowtieRiskAnalytics/0.1 (academic research)"
 
+# Patterns used on every listing page, compiled once at import.
+_NONWORD_RE = re.compile(r"[^\w\s-]")
+_DASHSPACE_RE = re.compile(r"[-\s]+")
+_PDF_LINK_RE = re.compile(
+    r'href="([^"]+\.pdf)"[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_YEAR_RE = re.compile(r"(\d{4})")
+
 
 def _slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
+    text = _NONWORD_RE.sub("", text)
+    text = _DASHSPACE_RE.sub("-", text)
     return text[:80]
 
 
@@ -42,13 +51,12 @@ def parse_bsee_listing(html: str, base_url: str = BSEE_BASE_URL) -> list[dict]:
 
     Returns list of dicts with keys: doc_id, url, title, date, page_url, source.
     """
-    pdf_pattern = re.compile(r'href="([^"]+\.pdf)"[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
     seen_urls: set[str] = set()
     results: list[dict] = []
 
-    for m in pdf_pattern.finditer(html):
+    for m in _PDF_LINK_RE.finditer(html):
         href = m.group(1)
-        link_text = re.sub(r"<[^>]+>", "", m.group(2)).strip()
+        link_text = _TAG_RE.sub("", m.group(2)).strip()
         pdf_url = urljoin(base_url, href)
 
         if pdf_url in seen_urls:
@@ -61,7 +69,7 @@ def parse_bsee_listing(html: str, base_url: str = BSEE_BASE_URL) -> list[dict]:
         title = link_text if link_text else doc_id
 
         # Try to extract year from filename
-        year_match = re.search(r"(\d{4})", href)
+        year_match = _YEAR_RE.search(href)
         date = f"{year_match.group(1)}-01-01" if year_match else ""
 
         results.append({
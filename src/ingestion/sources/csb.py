@@ -2,14 +2,18 @@
 import hashlib
 import logging
 import re
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterator, Optional
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
-from src.ingestion.manifests import IncidentManifestRow
+from src.ingestion.manifests import IncidentManifestRow, patch_incident_row
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +22,53 @@ CSB_COMPLETED_URL = f"{CSB_BASE_URL}/investigations/completed-investigations/"
 
 USER_AGENT = "BowtieRiskAnalytics/0.1 (academic research)"
 
+# Patterns compiled once at import; the scraping loops hit these once per
+# card/page, so skipping re's per-call cache lookup adds up on large runs.
+_NONWORD_RE = re.compile(r"[^\w\s-]")
+_DASHSPACE_RE = re.compile(r"[-\s]+")
+_PDF_HREF_RE = re.compile(r'href="([^"]+\.pdf)"')
+_RELEASED_DATE_RE = re.compile(
+    r"Final Report Released On:\s*</strong>\s*(\d{2}/\d{2}/\d{4})"
+)
+_DATE_WORDS_RE = re.compile(r"(\w+ \d{1,2}, \d{4})")
+_CTA_RE = re.compile(r"full\s+investigation\s+details", re.IGNORECASE)
+_ROOT_HREF_RE = re.compile(r'href="(/[^"/]+/)"', re.IGNORECASE)
+_H3_CARD_RE = re.compile(
+    r'<a\s[^>]*href="(/[^"/]+/)"[^>]*>.*?<h3[^>]*>(.*?)</h3>',
+    re.DOTALL | re.IGNORECASE,
+)
+
+_CSB_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%m/%d/%Y", "%Y-%m-%d")
+
+
+def _make_session() -> requests.Session:
+    """Build a Session with a sized connection pool and retry policy.
+
+    Discovery and downloads reuse warm TCP/TLS connections instead of
+    re-handshaking per request; transient 429/5xx responses retry with
+    backoff.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def _slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
+    text = _NONWORD_RE.sub("", text)
+    text = _DASHSPACE_RE.sub("-", text)
     return text[:50]
 
 
@@ -32,7 +77,7 @@ def _parse_csb_date(date_str: str) -> Optional[str]:
     if not date_str:
         return None
     try:
-        for fmt in ["%B %d, %Y", "%b %d, %Y", "%m/%d/%Y", "%Y-%m-%d"]:
+        for fmt in _CSB_DATE_FORMATS:
             try:
                 dt = datetime.strptime(date_str.strip(), fmt)
                 return dt.strftime("%Y-%m-%d")
@@ -69,21 +114,27 @@ def _extract_investigation_cards(html: str) -> list[tuple[str, str]]:
 
     A deny-list filters out remaining non-incident slugs.
     """
-    cta_pattern = re.compile(r"full\s+investigation\s+details", re.IGNORECASE)
-    cta_positions = [m.start() for m in cta_pattern.finditer(html)]
+    cta_positions = [m.start() for m in _CTA_RE.finditer(html)]
 
-    href_pattern = re.compile(r'href="(/[^"/]+/)"', re.IGNORECASE)
     seen: set[str] = set()
     results: list[tuple[str, str]] = []
 
     if cta_positions:
-        # CTA-based extraction: look in a 2000-char window before each CTA
+        # Single pass over the document for root-level hrefs; each CTA's
+        # 2000-char lookback window is then resolved with a bisect over the
+        # recorded match positions instead of re-scanning overlapping
+        # slices of the page per CTA.
+        href_matches = [
+            (m.start(), m.group(1)) for m in _ROOT_HREF_RE.finditer(html)
+        ]
+        href_starts = [start for start, _ in href_matches]
+
         for pos in cta_positions:
             window_start = max(0, pos - 2000)
-            window = html[window_start:pos]
+            lo = bisect_left(href_starts, window_start)
+            hi = bisect_left(href_starts, pos)
 
-            for m in href_pattern.finditer(window):
-                path = m.group(1)
+            for _, path in href_matches[lo:hi]:
                 slug = path.strip("/")
 
                 if slug.startswith("investigations"):
@@ -100,11 +151,7 @@ def _extract_investigation_cards(html: str) -> list[tuple[str, str]]:
                 results.append((path, title))
     else:
         # Fallback: <h3>-based extraction (tests, alternative markup)
-        h3_pattern = re.compile(
-            r'<a\s[^>]*href="(/[^"/]+/)"[^>]*>.*?<h3[^>]*>(.*?)</h3>',
-            re.DOTALL | re.IGNORECASE,
-        )
-        for m in h3_pattern.finditer(html):
+        for m in _H3_CARD_RE.finditer(html):
             path = m.group(1)
             title = m.group(2).strip()
             slug = path.strip("/")
@@ -118,20 +165,81 @@ def _extract_investigation_cards(html: str) -> list[tuple[str, str]]:
     return results
 
 
+def _fetch_detail(
+    session: requests.Session, detail_path: str, title: str
+) -> Optional[IncidentManifestRow]:
+    """Fetch one investigation detail page and build its manifest row.
+
+    Returns None when the page cannot be fetched or has no PDF link.
+    """
+    incident_id = detail_path.strip("/")
+    detail_url = urljoin(CSB_BASE_URL, detail_path)
+
+    try:
+        detail_resp = session.get(detail_url, timeout=30)
+    except requests.RequestException as e:
+        logger.warning(f"Failed to fetch detail page {detail_url}: {e}")
+        return None
+
+    if detail_resp.status_code != 200:
+        return None
+
+    detail_pdfs = _PDF_HREF_RE.findall(detail_resp.text)
+    # Look for "final report" or similar
+    pdf_url = None
+    for pdf_href in detail_pdfs:
+        if any(
+            kw in pdf_href.lower()
+            for kw in ["final", "report", "investigation"]
+        ):
+            pdf_url = urljoin(CSB_BASE_URL, pdf_href)
+            break
+    if not pdf_url and detail_pdfs:
+        pdf_url = urljoin(CSB_BASE_URL, detail_pdfs[0])
+
+    if not pdf_url:
+        return None
+
+    # Extract date if available
+    date_match = _RELEASED_DATE_RE.search(detail_resp.text)
+    if not date_match:
+        # Fallback to any date pattern
+        date_match = _DATE_WORDS_RE.search(detail_resp.text)
+    date_occurred = (
+        _parse_csb_date(date_match.group(1)) if date_match else None
+    )
+
+    pdf_filename = pdf_url.split("/")[-1]
+    if not pdf_filename.endswith(".pdf"):
+        pdf_filename = f"{incident_id}.pdf"
+
+    return IncidentManifestRow(
+        source="csb",
+        incident_id=incident_id,
+        title=title,
+        date_occurred=date_occurred,
+        detail_url=detail_url,
+        pdf_url=pdf_url,
+        pdf_path=f"csb/pdfs/{pdf_filename}",
+    )
+
+
 def discover_csb_incidents(limit: int = 20) -> Iterator[IncidentManifestRow]:
     """
     Scrape CSB completed investigations to discover incidents.
 
+    Detail pages for each listing page are fetched concurrently over a
+    shared keep-alive session, so discovery pays one round trip per page
+    batch instead of one per incident.
+
     Args:
         limit: Maximum number of incidents to discover.
 
     Yields:
         IncidentManifestRow objects with downloaded=False.
     """
-    session = requests.Session()
-    session.headers["User-Agent"] = USER_AGENT
+    session = _make_session()
 
-    pdf_pattern = r'href="([^"]+\.pdf)"'
     seen_ids: set[str] = set()
     count = 0
     page = 1
@@ -142,90 +250,53 @@ def discover_csb_incidents(limit: int = 20) -> Iterator[IncidentManifestRow]:
 
         try:
             resp = session.get(url, timeout=30)
-            if resp.status_code != 200:
-                logger.warning(f"CSB page {page} returned {resp.status_code}")
-                break
-
-            html = resp.text
-            investigations = _extract_investigation_cards(html)
-
-            if not investigations:
-                logger.info(f"No more investigations found on page {page}")
-                break
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch CSB page {page}: {e}")
+            break
 
-            for detail_path, title in investigations:
-                if count >= limit:
-                    break
+        if resp.status_code != 200:
+            logger.warning(f"CSB page {page} returned {resp.status_code}")
+            break
 
-                # Derive incident_id from the URL slug (stable, unique)
-                incident_id = detail_path.strip("/")
+        investigations = _extract_investigation_cards(resp.text)
 
-                # Deduplicate across pages
-                if incident_id in seen_ids:
-                    continue
-                seen_ids.add(incident_id)
-
-                detail_url = urljoin(CSB_BASE_URL, detail_path)
-
-                # Fetch detail page to get PDF link
-                try:
-                    detail_resp = session.get(detail_url, timeout=30)
-                    if detail_resp.status_code == 200:
-                        detail_pdfs = re.findall(pdf_pattern, detail_resp.text)
-                        # Look for "final report" or similar
-                        pdf_url = None
-                        for pdf_href in detail_pdfs:
-                            if any(
-                                kw in pdf_href.lower()
-                                for kw in ["final", "report", "investigation"]
-                            ):
-                                pdf_url = urljoin(CSB_BASE_URL, pdf_href)
-                                break
-                        if not pdf_url and detail_pdfs:
-                            pdf_url = urljoin(CSB_BASE_URL, detail_pdfs[0])
-
-                        if pdf_url:
-                            # Extract date if available
-                            date_match = re.search(
-                                r"Final Report Released On:\s*</strong>\s*(\d{2}/\d{2}/\d{4})",
-                                detail_resp.text,
-                            )
-                            if not date_match:
-                                # Fallback to any date pattern
-                                date_match = re.search(
-                                    r"(\w+ \d{1,2}, \d{4})", detail_resp.text
-                                )
-                            date_occurred = (
-                                _parse_csb_date(date_match.group(1))
-                                if date_match
-                                else None
-                            )
-
-                            pdf_filename = pdf_url.split("/")[-1]
-                            if not pdf_filename.endswith(".pdf"):
-                                pdf_filename = f"{incident_id}.pdf"
-
-                            yield IncidentManifestRow(
-                                source="csb",
-                                incident_id=incident_id,
-                                title=title,
-                                date_occurred=date_occurred,
-                                detail_url=detail_url,
-                                pdf_url=pdf_url,
-                                pdf_path=f"csb/pdfs/{pdf_filename}",
-                            )
-                            count += 1
-                            logger.info(f"Discovered CSB incident: {incident_id}")
-
-                except requests.RequestException as e:
-                    logger.warning(f"Failed to fetch detail page {detail_url}: {e}")
-                    continue
+        if not investigations:
+            logger.info(f"No more investigations found on page {page}")
+            break
 
-            page += 1
+        # Deduplicate across pages; ids are only marked seen once a fetch
+        # is actually attempted, so candidates deferred by the budget cap
+        # stay eligible on a later pass.
+        candidates = [
+            (detail_path, title)
+            for detail_path, title in investigations
+            if detail_path.strip("/") not in seen_ids
+        ]
+
+        # Fetch in budget-sized batches: a failed fetch frees its slot for
+        # the next candidate on the same page, so we still yield up to
+        # `limit` rows when some detail pages error out.
+        idx = 0
+        while idx < len(candidates) and count < limit:
+            batch = candidates[idx: idx + (limit - count)]
+            idx += len(batch)
+            for detail_path, _ in batch:
+                seen_ids.add(detail_path.strip("/"))
+
+            with ThreadPoolExecutor(
+                max_workers=min(16, len(batch))
+            ) as executor:
+                rows = executor.map(
+                    lambda pair: _fetch_detail(session, *pair), batch
+                )
+                for row in rows:
+                    if row is None:
+                        continue
+                    yield row
+                    count += 1
+                    logger.info(f"Discovered CSB incident: {row.incident_id}")
 
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch CSB page {page}: {e}")
-            break
+        page += 1
 
 
 def download_csb_pdf(
@@ -258,46 +329,85 @@ def download_csb_pdf(
             }
 
             if resp.status_code != 200:
-                return row.model_copy(update={**updated, "downloaded": False})
+                return patch_incident_row(row, **updated, downloaded=False)
 
             # Validate PDF content type
             content_type = updated["content_type"].lower()
             is_pdf = "pdf" in content_type or row.pdf_url.lower().endswith(".pdf")
 
             if not is_pdf:
-                return row.model_copy(
-                    update={
-                        **updated,
-                        "downloaded": False,
-                        "error": f"Not a PDF: {content_type}",
-                    }
+                return patch_incident_row(
+                    row,
+                    **updated,
+                    downloaded=False,
+                    error=f"Not a PDF: {content_type}",
                 )
 
-            # Stream to disk with incremental hash
+            # Hash the 1 MiB chunks as they stream: the bytes are already
+            # in memory, so this avoids re-reading the finished file, and
+            # hashlib drops the GIL for updates this large.
             sha = hashlib.sha256()
-            size = 0
-
             with open(pdf_full_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
+                for chunk in resp.iter_content(chunk_size=1 << 20):
                     f.write(chunk)
                     sha.update(chunk)
-                    size += len(chunk)
-
-            return row.model_copy(
-                update={
-                    **updated,
-                    "downloaded": True,
-                    "file_size_bytes": size,
-                    "sha256": sha.hexdigest(),
-                }
+            sha256 = sha.hexdigest()
+
+            return patch_incident_row(
+                row,
+                **updated,
+                downloaded=True,
+                file_size_bytes=pdf_full_path.stat().st_size,
+                sha256=sha256,
             )
 
     except requests.RequestException as e:
         logger.warning(f"Failed to download {row.incident_id}: {e}")
-        return row.model_copy(
-            update={
-                "retrieved_at": datetime.now(timezone.utc),
-                "downloaded": False,
-                "error": str(e),
-            }
+        return patch_incident_row(
+            row,
+            retrieved_at=datetime.now(timezone.utc),
+            downloaded=False,
+            error=str(e),
         )
+
+
+def download_csb_pdfs(
+    rows: list[IncidentManifestRow],
+    base_dir: Path,
+    timeout: int = 30,
+    concurrency: int = 8,
+) -> list[IncidentManifestRow]:
+    """
+    Download PDFs for many CSB incidents concurrently.
+
+    The workload is network-bound, so rows fan out across a bounded thread
+    pool; each worker keeps its own requests.Session (keep-alive per
+    thread) so connections are reused without sharing a session across
+    threads.
+
+    Args:
+        rows: Incident manifest rows with pdf_url set.
+        base_dir: Base directory for downloads.
+        timeout: Per-request timeout in seconds.
+        concurrency: Max downloads in flight.
+
+    Returns:
+        Updated rows in input order.
+    """
+    if not rows:
+        return []
+
+    thread_local = threading.local()
+
+    def _session() -> requests.Session:
+        session = getattr(thread_local, "session", None)
+        if session is None:
+            session = _make_session()
+            thread_local.session = session
+        return session
+
+    def _download(row: IncidentManifestRow) -> IncidentManifestRow:
+        return download_csb_pdf(row, base_dir, _session(), timeout=timeout)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(rows))) as executor:
+        return list(executor.map(_download, rows))
@@ -18,6 +18,28 @@ CSB_BASE_URL = "https://www.csb.gov"
 CSB_COMPLETED_URL = f"{CSB_BASE_URL}/investigations/completed-investigations/"
 USER_AGENT = "BowtieRiskAnalytics/0.1 (academic research)"
 
+# Patterns used on every listing/detail page, compiled once at import.
+_NONWORD_RE = re.compile(r"[^\w\s-]")
+_DASHSPACE_RE = re.compile(r"[-\s]+")
+_CTA_RE = re.compile(r"full\s+investigation\s+details", re.IGNORECASE)
+_ROOT_HREF_RE = re.compile(r'href="(/[^"/]+/)"', re.IGNORECASE)
+_H3_CARD_RE = re.compile(
+    r'<a\s[^>]*href="(/[^"/]+/)"[^>]*>.*?<h3[^>]*>(.*?)</h3>',
+    re.DOTALL | re.IGNORECASE,
+)
+_SCS_PDF_RE = re.compile(r"/scs[^/]*\.pdf$")
+_ANCHOR_RE = re.compile(
+    r'<a\s[^>]*?href="([^"]+)"[^>]*?>(.*?)</a>', re.IGNORECASE | re.DOTALL
+)
+_H1_RE = re.compile(r"<h1[^>]*>(.*?)</h1>", re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_RELEASED_DATE_RE = re.compile(
+    r"Final Report Released On:\s*</strong>\s*(\d{2}/\d{2}/\d{4})"
+)
+_DATE_WORDS_RE = re.compile(r"(\w+ \d{1,2}, \d{4})")
+_DOC_ID_RE = re.compile(r"/file\.aspx\?DocumentId=\d+", re.IGNORECASE)
+_PDF_HREF_RE = re.compile(r'href="([^"]+\.pdf)"', re.IGNORECASE)
+
 # Slugs in root-level hrefs that are NOT investigation detail pages.
 _SLUG_DENYLIST = frozenset({
     "investigations", "completed-investigations", "current-investigations",
@@ -28,8 +50,8 @@ _SLUG_DENYLIST = frozenset({
 def _slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
+    text = _NONWORD_RE.sub("", text)
+    text = _DASHSPACE_RE.sub("-", text)
     return text[:80]
 
 
@@ -54,17 +76,15 @@ def parse_listing_page(html: str) -> list[tuple[str, str]]:
     Uses the "full investigation details" CTA pattern, falling back to
     ``<h3>``-based matching for simpler markup (test fixtures).
     """
-    cta_pattern = re.compile(r"full\s+investigation\s+details", re.IGNORECASE)
-    cta_positions = [m.start() for m in cta_pattern.finditer(html)]
+    cta_positions = [m.start() for m in _CTA_RE.finditer(html)]
 
-    href_pattern = re.compile(r'href="(/[^"/]+/)"', re.IGNORECASE)
     seen: set[str] = set()
     results: list[tuple[str, str]] = []
 
     if cta_positions:
         for pos in cta_positions:
             window = html[max(0, pos - 2000):pos]
-            for m in href_pattern.finditer(window):
+            for m in _ROOT_HREF_RE.finditer(window):
                 path = m.group(1)
                 slug = path.strip("/")
                 if slug.startswith("investigations") or len(slug) < 3:
@@ -75,11 +95,7 @@ def parse_listing_page(html: str) -> list[tuple[str, str]]:
                 title = slug.replace("-", " ").strip("- ").title()
                 results.append((path, title))
     else:
-        h3_pat = re.compile(
-            r'<a\s[^>]*href="(/[^"/]+/)"[^>]*>.*?<h3[^>]*>(.*?)</h3>',
-            re.DOTALL | re.IGNORECASE,
-        )
-        for m in h3_pat.finditer(html):
+        for m in _H3_CARD_RE.finditer(html):
             path, title = m.group(1), m.group(2).strip()
             slug = path.strip("/")
             if slug in _SLUG_DENYLIST or slug in seen:
@@ -104,7 +120,7 @@ def _score_pdf_href(href: str) -> int:
         score -= 10
     if "status_change_summary" in lower:
         score -= 8
-    if re.search(r"/scs[^/]*\.pdf$", lower):
+    if _SCS_PDF_RE.search(lower):
         score -= 8
 
     # Bonuses for "good" keywords
@@ -123,11 +139,7 @@ def _extract_document_links(html: str) -> list[tuple[str, str]]:
 
     Captures both simple and multi-line anchor tags.
     """
-    return re.findall(
-        r'<a\s[^>]*?href="([^"]+)"[^>]*?>(.*?)</a>',
-        html,
-        re.IGNORECASE | re.DOTALL,
-    )
+    return _ANCHOR_RE.findall(html)
 
 
 def parse_detail_page(html: str, base_url: str = CSB_BASE_URL) -> dict:
@@ -143,28 +155,25 @@ def parse_detail_page(html: str, base_url: str = CSB_BASE_URL) -> dict:
     result: dict[str, Optional[str]] = {"pdf_url": None, "title": None, "date": None}
 
     # Title from <h1>
-    h1 = re.search(r"<h1[^>]*>(.*?)</h1>", html, re.DOTALL)
+    h1 = _H1_RE.search(html)
     if h1:
-        result["title"] = re.sub(r"<[^>]+>", "", h1.group(1)).strip()
+        result["title"] = _TAG_RE.sub("", h1.group(1)).strip()
 
     # Date
-    date_match = re.search(
-        r"Final Report Released On:\s*</strong>\s*(\d{2}/\d{2}/\d{4})", html
-    )
+    date_match = _RELEASED_DATE_RE.search(html)
     if not date_match:
-        date_match = re.search(r"(\w+ \d{1,2}, \d{4})", html)
+        date_match = _DATE_WORDS_RE.search(html)
     if date_match:
         result["date"] = _parse_csb_date(date_match.group(1))
 
     # ── Tier 1: DocumentId final-report links ───────────────────────────
     all_links = _extract_document_links(html)
-    doc_id_pat = re.compile(r"/file\.aspx\?DocumentId=\d+", re.IGNORECASE)
 
     final_report_links: list[tuple[str, str]] = []  # (href, anchor_text)
     for href, text in all_links:
-        clean_text = re.sub(r"<[^>]+>", "", text).strip()
-        if doc_id_pat.search(href) or "final report" in clean_text.lower():
-            if doc_id_pat.search(href) or doc_id_pat.search(href):
+        clean_text = _TAG_RE.sub("", text).strip()
+        if _DOC_ID_RE.search(href) or "final report" in clean_text.lower():
+            if _DOC_ID_RE.search(href) or _DOC_ID_RE.search(href):
                 final_report_links.append((href, clean_text))
             elif href.lower().endswith(".pdf"):
                 final_report_links.append((href, clean_text))
@@ -180,7 +189,7 @@ def parse_detail_page(html: str, base_url: str = CSB_BASE_URL) -> dict:
         return result
 
     # ── Tier 2 & 3: .pdf links, scored ──────────────────────────────────
-    pdf_hrefs = re.findall(r'href="([^"]+\.pdf)"', html, re.IGNORECASE)
+    pdf_hrefs = _PDF_HREF_RE.findall(html)
     if not pdf_hrefs:
         return result
 
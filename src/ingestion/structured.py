@@ -1,18 +1,32 @@
 """Structured extraction: text -> LLM -> validated JSON."""
-import csv
+import gzip
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from collections import Counter
 from typing import Any, Callable, Optional
 
-from pydantic import BaseModel, ConfigDict
-
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+# orjson parses/serializes JSON several times faster than stdlib json
+# (C parser, SIMD UTF-8 validation) — worthwhile on large LLM payloads.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.ingestion.manifests import (
+    _load_cached_rows,
+    _read_manifest_records,
+    _write_cached_rows,
+    _write_csv_rows,
+)
 from src.llm.base import LLMProvider
-from src.models.incident_v23 import IncidentV23
 from src.prompts.loader import load_prompt
-from src.validation.incident_validator import validate_incident_v23
+from src.validation.incident_validator import parse_incident_v23
 
 logger = logging.getLogger(__name__)
 
@@ -34,32 +48,33 @@ class StructuredManifestRow(BaseModel):
     raw_response_path: Optional[str] = None
 
 
+# Column order for the CSV writer, computed once at import.
+_STRUCTURED_FIELDS = tuple(StructuredManifestRow.model_fields.keys())
+
+# One pydantic-core call serializes the whole manifest at save time.
+_STRUCTURED_LIST = TypeAdapter(list[StructuredManifestRow])
+
+
 def load_structured_manifest(path: Path) -> list[StructuredManifestRow]:
-    """Load structured extraction manifest from CSV."""
-    if not path.exists():
-        return []
+    """Load structured extraction manifest from CSV.
 
-    rows: list[StructuredManifestRow] = []
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row_dict in reader:
-            # Convert string booleans
-            for key in ("extracted", "valid"):
-                if key in row_dict:
-                    row_dict[key] = row_dict[key].lower() == "true"
-            # Parse datetime
-            if "extracted_at" in row_dict and row_dict["extracted_at"]:
-                row_dict["extracted_at"] = datetime.fromisoformat(
-                    row_dict["extracted_at"]
-                )
-            elif "extracted_at" in row_dict:
-                row_dict["extracted_at"] = None
-            # Handle empty optional strings → None
-            for key in ("model", "validation_errors", "error", "raw_response_path"):
-                if key in row_dict and row_dict[key] == "":
-                    row_dict[key] = None
-            rows.append(StructuredManifestRow(**row_dict))
-    return rows
+    Column coercion runs vectorized via the shared manifest reader, and
+    rows are built with model_construct — the file is our own round-trip
+    output, so re-validation is skipped.
+    """
+    if not path.is_file():
+        logger.warning(f"Manifest not found: {path}")
+        return []
+    cached = _load_cached_rows(path)
+    if cached is not None:
+        return cached
+    records = _read_manifest_records(
+        path,
+        bool_cols=("extracted", "valid"),
+        datetime_cols=("extracted_at",),
+        optional_str_cols=("model", "validation_errors", "error", "raw_response_path"),
+    )
+    return [StructuredManifestRow.model_construct(**rec) for rec in records]
 
 
 def _manifest_key(row: StructuredManifestRow) -> tuple[str, str]:
@@ -72,71 +87,81 @@ def merge_structured_manifests(
     new: list[StructuredManifestRow],
 ) -> list[StructuredManifestRow]:
     """Merge manifest rows, upserting by (incident_id, provider). New wins."""
-    by_key: dict[tuple[str, str], StructuredManifestRow] = {}
-    for row in existing:
-        by_key[_manifest_key(row)] = row
-    for row in new:
-        by_key[_manifest_key(row)] = row
+    by_key = {_manifest_key(row): row for row in existing}
+    by_key.update((_manifest_key(row), row) for row in new)
     return list(by_key.values())
 
 
 def save_structured_manifest(rows: list[StructuredManifestRow], path: Path) -> None:
     """Save structured extraction manifest to CSV."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = list(StructuredManifestRow.model_fields.keys())
 
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            row_dict = row.model_dump()
-            if row_dict["extracted_at"]:
-                row_dict["extracted_at"] = row_dict["extracted_at"].isoformat()
-            row_dict = {k: ("" if v is None else v) for k, v in row_dict.items()}
-            row_dict["extracted"] = str(row_dict["extracted"])
-            row_dict["valid"] = str(row_dict["valid"])
-            writer.writerow(row_dict)
+    # mode="json" already emits ISO strings for datetimes; the shared
+    # writer handles None -> "" for the CSV cells.
+    dicts = _STRUCTURED_LIST.dump_python(rows, mode="json")
+
+    _write_csv_rows(path, _STRUCTURED_FIELDS, dicts)
+    _write_cached_rows(path, rows)
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON via orjson when available, stdlib json otherwise.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the stdlib type either way.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    """Write payload as 2-space-indented JSON, via orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+# Stdlib decoder for strategy 3: raw_decode stops at the end of the first
+# valid JSON value, scanning in C instead of a Python per-char brace loop.
+_JSON_DECODER = json.JSONDecoder()
 
 
 def _parse_llm_json(raw: str) -> dict:
     """Extract JSON from LLM response with fallback strategies.
 
-    1. Try ``json.loads`` on the stripped response.
+    1. Try a direct parse on the stripped response.
     2. Strip markdown fences and retry.
-    3. Extract the first ``{...}`` block via brace-matching and retry.
+    3. Decode the first ``{...}`` value in place via raw_decode.
 
     Raises:
         json.JSONDecodeError: If all strategies fail.
     """
-    text = raw.strip()
-
-    # Strategy 1: direct parse
+    # Strategy 1: direct parse. Surrounding whitespace is valid JSON, so
+    # the common clean-response case skips the strip() copy entirely.
     try:
-        return json.loads(text)
+        return _json_loads(raw)
     except json.JSONDecodeError:
         pass
 
+    text = raw.strip()
+
     # Strategy 2: strip markdown fences
     if text.startswith("```"):
         lines = text.split("\n")
         lines = [ln for ln in lines if not ln.strip().startswith("```")]
         try:
-            return json.loads("\n".join(lines))
+            return _json_loads("\n".join(lines))
         except json.JSONDecodeError:
             pass
 
-    # Strategy 3: extract first {...} block (brace-balanced)
+    # Strategy 3: decode the first {...} value in place. Unlike the old
+    # brace-counting loop this runs in C and handles braces inside strings.
     start = text.find("{")
     if start != -1:
-        depth = 0
-        for i in range(start, len(text)):
-            if text[i] == "{":
-                depth += 1
-            elif text[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    candidate = text[start : i + 1]
-                    return json.loads(candidate)  # let it raise if still bad
+        obj, _end = _JSON_DECODER.raw_decode(text, start)  # let it raise if bad
+        return obj
 
     raise json.JSONDecodeError("No JSON object found in LLM response", text, 0)
 
@@ -144,14 +169,173 @@ def _parse_llm_json(raw: str) -> dict:
 def _save_raw_response(
     raw: str, provider_name: str, incident_id: str, base_dir: Path,
 ) -> Path:
-    """Persist the raw LLM response text and return the path."""
+    """Persist the raw LLM response (gzip-compressed) and return the path.
+
+    The archive is write-only debug material and LLM output compresses
+    well (repeated schema keys), so gzip cuts the on-disk footprint
+    several-fold; read back with gzip.open / zcat.
+    """
     raw_dir = base_dir / "debug_llm_responses" / provider_name
     raw_dir.mkdir(parents=True, exist_ok=True)
-    raw_path = raw_dir / f"{incident_id}.txt"
-    raw_path.write_text(raw, encoding="utf-8")
+    raw_path = raw_dir / f"{incident_id}.txt.gz"
+    with gzip.open(raw_path, "wt", encoding="utf-8", compresslevel=5) as f:
+        f.write(raw)
     return raw_path
 
 
+def _extract_one_file(
+    txt_path: Path,
+    provider_out_dir: Path,
+    out_dir: Path,
+    provider: Optional[LLMProvider],
+    provider_name: str,
+    model_name: Optional[str],
+    text_limit: int,
+    _ladder_fn: Optional[Callable],
+) -> StructuredManifestRow:
+    """Extract one text file to validated JSON (worker for the thread pool)."""
+    incident_id = txt_path.stem
+    json_path = provider_out_dir / f"{incident_id}.json"
+
+    row = StructuredManifestRow(
+        incident_id=incident_id,
+        source_text_path=str(txt_path),
+        output_json_path=str(json_path),
+        provider=provider_name,
+        model=model_name,
+    )
+
+    try:
+        text = txt_path.read_text(encoding="utf-8")
+        if not text.strip():
+            row.error = "Empty text file"
+            return row
+
+        # Optional text truncation (mirrors corpus-extract --text-limit)
+        if text_limit > 0 and len(text) > text_limit:
+            logger.info(
+                f"{incident_id}: text truncated {len(text)} → {text_limit} chars"
+            )
+            text = text[:text_limit]
+
+        # Assemble prompt
+        prompt = load_prompt(text)
+
+        # ── Extraction: ladder path or single-provider path ───────────────
+        payload: Optional[dict] = None
+
+        if _ladder_fn is not None:
+            # Policy-driven model ladder — hard safety net, never raises
+            try:
+                data, _truncated, model_used = _ladder_fn(incident_id, prompt)
+                row.model = model_used
+                payload = data
+            except Exception as exc:
+                logger.exception(
+                    f"{incident_id}: ladder raised unexpected error — {exc}"
+                )
+                payload = None
+
+            if payload is None:
+                error_payload = {
+                    "incident_id": incident_id,
+                    "errors": ["ladder: all models failed or raised error"],
+                }
+                _write_json(json_path, error_payload)
+                row.extracted = True
+                row.extracted_at = datetime.now(timezone.utc)
+                row.valid = False
+                row.validation_errors = "ladder: all models failed"
+                logger.warning(f"{incident_id}: ladder failed — recorded in manifest")
+                return row
+
+        else:
+            # Single-provider path (backward-compatible)
+            raw_response = provider.extract(prompt)  # type: ignore[union-attr]
+
+            # Save raw response
+            raw_path = _save_raw_response(
+                raw_response, provider_name, incident_id, out_dir.parent,
+            )
+            row.raw_response_path = str(raw_path)
+
+            # Parse JSON from response (with one retry on parse failure)
+            parse_err = None
+            for _parse_attempt in range(2):
+                try:
+                    payload = _parse_llm_json(raw_response)
+                    break
+                except json.JSONDecodeError as e:
+                    parse_err = e
+                    if _parse_attempt == 0:
+                        logger.warning(
+                            f"{incident_id}: JSON parse failed, retrying with full prompt"
+                        )
+                        _STRICT_SUFFIX = (
+                            "\n\nCRITICAL: Return ONLY a single valid JSON object. "
+                            "No prose, no markdown fences, no explanation."
+                        )
+                        try:
+                            raw_response = provider.extract(  # type: ignore[union-attr]
+                                prompt + _STRICT_SUFFIX
+                            )
+                            raw_path = _save_raw_response(
+                                raw_response, provider_name, incident_id,
+                                out_dir.parent,
+                            )
+                            row.raw_response_path = str(raw_path)
+                        except Exception:
+                            break  # retry failed, fall through
+
+            if payload is None:
+                error_payload = {
+                    "incident_id": incident_id,
+                    "errors": [f"JSON parse error: {parse_err}"],
+                    "raw": raw_response[:2000],
+                }
+                _write_json(json_path, error_payload)
+                row.extracted = True
+                row.extracted_at = datetime.now(timezone.utc)
+                row.valid = False
+                row.validation_errors = f"JSON parse error: {parse_err}"
+                logger.warning(f"{incident_id}: JSON parse failed: {parse_err}")
+                return row
+
+        # ── Both paths converge here with payload set ─────────────────────
+        # Override incident_id with filename-based ID
+        payload["incident_id"] = incident_id
+
+        # Validate and parse in one pass (the model round-trip fills in all
+        # defaults/missing sections; no second model_validate needed)
+        model, errors = parse_incident_v23(payload)
+        is_valid = model is not None
+        row.valid = is_valid
+        row.extracted = True
+        row.extracted_at = datetime.now(timezone.utc)
+
+        if is_valid:
+            out_payload = model.model_dump(mode="json")
+        else:
+            row.validation_errors = "; ".join(errors[:5])  # Cap at 5 errors
+            logger.warning(f"{incident_id}: validation failed: {errors[:3]}")
+            payload["_validation_errors"] = errors
+            # Fall back to raw payload when the model can't be built
+            out_payload = payload
+
+        # Preserve validation errors in output for debugging
+        if "_validation_errors" in payload:
+            out_payload["_validation_errors"] = payload["_validation_errors"]
+
+        _write_json(json_path, out_payload)
+        logger.info(f"{incident_id}: extracted (valid={is_valid})")
+
+    except Exception as e:
+        row.error = str(e)[:200]
+        logger.exception(f"{incident_id}: extraction failed: {e}")
+
+    return row
+
+
 def extract_structured(
     text_dir: Path,
     out_dir: Path,
@@ -161,10 +345,17 @@ def extract_structured(
     limit: Optional[int] = None,
     resume: bool = False,
     text_limit: int = 0,
+    concurrency: int = 8,
     _ladder_fn: Optional[Callable] = None,
 ) -> list[StructuredManifestRow]:
     """Run structured extraction on all .txt files in text_dir.
 
+    Files are processed concurrently: the dominant cost is the remote LLM
+    round trip, which releases the GIL while waiting, so a thread pool
+    overlaps the per-incident latency. The provider (or ladder callable)
+    must therefore be safe to call from multiple threads — providers
+    backed by requests sessions and the StubProvider are.
+
     Args:
         text_dir: Directory containing extracted text files.
         out_dir: Directory to write validated JSON files.
@@ -175,193 +366,74 @@ def extract_structured(
         resume: If True, skip files that already have output JSON.
         text_limit: Truncate text to this many chars before building the prompt
             (0 = no limit).  Matches corpus-extract --text-limit behaviour.
+        concurrency: Max extractions in flight (keep within provider rate limits).
         _ladder_fn: Optional policy-driven ladder callable
             ``(incident_id, prompt, *, policy_path) -> (dict|None, bool, str|None)``.
             When set, replaces the single-provider extraction path with a
             multi-model ladder; every file still produces a manifest row.
 
     Returns:
-        List of manifest rows tracking extraction results.
+        List of manifest rows tracking extraction results (input file order).
     """
     provider_out_dir = out_dir / provider_name
     provider_out_dir.mkdir(parents=True, exist_ok=True)
-    rows: list[StructuredManifestRow] = []
 
-    # Scan directory and all subdirectories for .txt files
-    txt_files = sorted(text_dir.rglob("*.txt"))
+    # Scan directory and all subdirectories for .txt files. os.walk batches
+    # directory entries per getdents call instead of a stat per rglob match.
+    txt_files = sorted(
+        Path(root) / name
+        for root, _dirs, files in os.walk(text_dir)
+        for name in files
+        if name.endswith(".txt")
+    )
     if not txt_files:
         logger.warning(f"No .txt files found in {text_dir} (checked subdirs too)")
-        return rows
+        return []
 
     logger.info(f"Processing {len(txt_files)} text files with provider={provider_name}")
 
-    processed = 0
+    # Resume check: one scandir over the output dir instead of an exists()
+    # syscall per text file.
+    already_extracted: set[str] = set()
+    if resume:
+        with os.scandir(provider_out_dir) as it:
+            already_extracted = {
+                entry.name[:-5] for entry in it if entry.name.endswith(".json")
+            }
+
+    # Apply resume / limit up front so the pool only ever sees work that
+    # must produce a manifest row.
+    eligible: list[Path] = []
     for txt_path in txt_files:
-        incident_id = txt_path.stem
-        json_path = provider_out_dir / f"{incident_id}.json"
-
-        # Resume: skip already-extracted files
-        if resume and json_path.exists():
-            logger.info(f"{incident_id}: already extracted, skipping (--resume)")
+        if resume and txt_path.stem in already_extracted:
+            logger.info(f"{txt_path.stem}: already extracted, skipping (--resume)")
             continue
-
-        # Limit guard
-        if limit is not None and processed >= limit:
+        if limit is not None and len(eligible) >= limit:
             logger.info(f"Reached --limit={limit}, stopping.")
             break
+        eligible.append(txt_path)
 
-        row = StructuredManifestRow(
-            incident_id=incident_id,
-            source_text_path=str(txt_path),
-            output_json_path=str(json_path),
-            provider=provider_name,
-            model=model_name,
-        )
-
-        try:
-            text = txt_path.read_text(encoding="utf-8")
-            if not text.strip():
-                row.error = "Empty text file"
-                rows.append(row)
-                processed += 1
-                continue
-
-            # Optional text truncation (mirrors corpus-extract --text-limit)
-            if text_limit > 0 and len(text) > text_limit:
-                logger.info(
-                    f"{incident_id}: text truncated {len(text)} → {text_limit} chars"
-                )
-                text = text[:text_limit]
-
-            # Assemble prompt
-            prompt = load_prompt(text)
-
-            # ── Extraction: ladder path or single-provider path ───────────────
-            payload: Optional[dict] = None
-
-            if _ladder_fn is not None:
-                # Policy-driven model ladder — hard safety net, never raises
-                try:
-                    data, _truncated, model_used = _ladder_fn(incident_id, prompt)
-                    row.model = model_used
-                    payload = data
-                except Exception as exc:
-                    logger.exception(
-                        f"{incident_id}: ladder raised unexpected error — {exc}"
-                    )
-                    payload = None
-
-                if payload is None:
-                    error_payload = {
-                        "incident_id": incident_id,
-                        "errors": ["ladder: all models failed or raised error"],
-                    }
-                    json_path.write_text(
-                        json.dumps(error_payload, indent=2), encoding="utf-8"
-                    )
-                    row.extracted = True
-                    row.extracted_at = datetime.now(timezone.utc)
-                    row.valid = False
-                    row.validation_errors = "ladder: all models failed"
-                    rows.append(row)
-                    processed += 1
-                    logger.warning(f"{incident_id}: ladder failed — recorded in manifest")
-                    continue
-
-            else:
-                # Single-provider path (backward-compatible)
-                raw_response = provider.extract(prompt)  # type: ignore[union-attr]
-
-                # Save raw response
-                raw_path = _save_raw_response(
-                    raw_response, provider_name, incident_id, out_dir.parent,
-                )
-                row.raw_response_path = str(raw_path)
-
-                # Parse JSON from response (with one retry on parse failure)
-                parse_err = None
-                for _parse_attempt in range(2):
-                    try:
-                        payload = _parse_llm_json(raw_response)
-                        break
-                    except json.JSONDecodeError as e:
-                        parse_err = e
-                        if _parse_attempt == 0:
-                            logger.warning(
-                                f"{incident_id}: JSON parse failed, retrying with full prompt"
-                            )
-                            _STRICT_SUFFIX = (
-                                "\n\nCRITICAL: Return ONLY a single valid JSON object. "
-                                "No prose, no markdown fences, no explanation."
-                            )
-                            try:
-                                raw_response = provider.extract(  # type: ignore[union-attr]
-                                    prompt + _STRICT_SUFFIX
-                                )
-                                raw_path = _save_raw_response(
-                                    raw_response, provider_name, incident_id,
-                                    out_dir.parent,
-                                )
-                                row.raw_response_path = str(raw_path)
-                            except Exception:
-                                break  # retry failed, fall through
-
-                if payload is None:
-                    error_payload = {
-                        "incident_id": incident_id,
-                        "errors": [f"JSON parse error: {parse_err}"],
-                        "raw": raw_response[:2000],
-                    }
-                    json_path.write_text(
-                        json.dumps(error_payload, indent=2), encoding="utf-8",
-                    )
-                    row.extracted = True
-                    row.extracted_at = datetime.now(timezone.utc)
-                    row.valid = False
-                    row.validation_errors = f"JSON parse error: {parse_err}"
-                    rows.append(row)
-                    processed += 1
-                    logger.warning(f"{incident_id}: JSON parse failed: {parse_err}")
-                    continue
-
-            # ── Both paths converge here with payload set ─────────────────────
-            # Override incident_id with filename-based ID
-            payload["incident_id"] = incident_id
-
-            # Validate
-            is_valid, errors = validate_incident_v23(payload)
-            row.valid = is_valid
-            row.extracted = True
-            row.extracted_at = datetime.now(timezone.utc)
-
-            if not is_valid:
-                row.validation_errors = "; ".join(errors[:5])  # Cap at 5 errors
-                logger.warning(f"{incident_id}: validation failed: {errors[:3]}")
-                payload["_validation_errors"] = errors
-
-            # Round-trip through model to fill in all defaults/missing sections
-            try:
-                model = IncidentV23.model_validate(payload)
-                out_payload = model.model_dump(mode="json")
-            except Exception:
-                # If model_validate fails, fall back to raw payload
-                out_payload = payload
-
-            # Preserve validation errors in output for debugging
-            if "_validation_errors" in payload:
-                out_payload["_validation_errors"] = payload["_validation_errors"]
-
-            json_path.write_text(json.dumps(out_payload, indent=2), encoding="utf-8")
-            logger.info(f"{incident_id}: extracted (valid={is_valid})")
+    if not eligible:
+        return []
 
-        except Exception as e:
-            row.error = str(e)[:200]
-            logger.exception(f"{incident_id}: extraction failed: {e}")
+    def _worker(txt_path: Path) -> StructuredManifestRow:
+        return _extract_one_file(
+            txt_path,
+            provider_out_dir,
+            out_dir,
+            provider,
+            provider_name,
+            model_name,
+            text_limit,
+            _ladder_fn,
+        )
 
-        rows.append(row)
-        processed += 1
+    max_workers = min(concurrency, len(eligible))
+    if max_workers == 1:
+        return [_worker(txt_path) for txt_path in eligible]
 
-    return rows
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_worker, eligible))
 
 
 def generate_run_report(
@@ -433,7 +505,7 @@ def compute_quality_gate(incident_dir: Path) -> dict[str, Any]:
 
     for jp in json_files:
         try:
-            data = json.loads(jp.read_text(encoding="utf-8"))
+            data = _json_loads(jp.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
             continue
 
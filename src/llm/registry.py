@@ -1,5 +1,6 @@
 """Provider registry: resolve provider name to LLMProvider instance."""
 import os
+from functools import lru_cache
 from typing import Any, Optional
 
 from src.llm.base import LLMProvider
@@ -12,7 +13,12 @@ _ENV_KEY_MAP = {
 
 
 def get_provider(name: str, model: Optional[str] = None, **kwargs: Any) -> LLMProvider:
-    """Return an LLMProvider instance for *name*.
+    """Return an LLMProvider instance for *name*, memoized per arguments.
+
+    Repeated calls with the same arguments return the same instance, so
+    provider setup (and any connection reuse it enables) is paid once per
+    process. The API-key env var is read on first construction; call
+    clear_provider_cache() if the environment changes mid-process (tests).
 
     Args:
         name: One of ``stub``, ``anthropic``.
@@ -28,6 +34,19 @@ def get_provider(name: str, model: Optional[str] = None, **kwargs: Any) -> LLMPr
         RuntimeError: If a required API-key env-var is missing for non-stub
             providers.
     """
+    return _build_provider(name, model, tuple(sorted(kwargs.items())))
+
+
+def clear_provider_cache() -> None:
+    """Drop memoized provider instances (e.g. after changing env vars)."""
+    _build_provider.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _build_provider(
+    name: str, model: Optional[str], kwargs_items: tuple
+) -> LLMProvider:
+    kwargs = dict(kwargs_items)
     if name not in SUPPORTED_PROVIDERS:
         raise ValueError(
             f"Unknown provider: {name!r}. Supported: {', '.join(SUPPORTED_PROVIDERS)}"
@@ -1,5 +1,6 @@
 """Prompt template loader for incident extraction."""
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -8,6 +9,79 @@ _DEFAULT_PROMPT_PATH = Path(__file__).resolve().parent.parent.parent / "assets"
 _DEFAULT_SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "assets" / "schema" / "incident_schema_v2_3_template.json"
 
 
+@lru_cache(maxsize=4)
+def _merge_template(
+    prompt_path_str: str,
+    prompt_mtime_ns: int,
+    schema_path_str: str,
+    schema_mtime_ns: int,
+) -> str:
+    """Read and merge template + schema, cached per (path, mtime) pair."""
+    prompt_template = Path(prompt_path_str).read_text(encoding="utf-8")
+    schema_template = Path(schema_path_str).read_text(encoding="utf-8")
+    return prompt_template.replace("{{SCHEMA_TEMPLATE}}", schema_template)
+
+
+def load_prompt_template(
+    schema_path: Path | None = None,
+    prompt_path: Path | None = None,
+) -> str:
+    """Load the prompt template with the schema merged in, cached by mtime.
+
+    The template and schema files are loop-invariant across an extraction
+    run, so they are read and merged once and cached; only the incident
+    text substitution happens per call in render_prompt. The cache key
+    includes st_mtime_ns, so editing either file invalidates the entry
+    at the cost of one stat per file per call.
+
+    Args:
+        schema_path: Path to JSON schema template. Defaults to assets/schema/incident_schema_v2_3_template.json.
+        prompt_path: Path to prompt template. Defaults to assets/prompts/extract_incident.md.
+
+    Returns:
+        Prompt template string with the schema placeholder replaced and the
+        {{INCIDENT_TEXT}} placeholder still present.
+
+    Raises:
+        FileNotFoundError: If prompt or schema file doesn't exist.
+    """
+    prompt_path = prompt_path or _DEFAULT_PROMPT_PATH
+    schema_path = schema_path or _DEFAULT_SCHEMA_PATH
+
+    # stat doubles as the existence check, so each file costs one syscall
+    try:
+        prompt_mtime_ns = prompt_path.stat().st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"Prompt template not found: {prompt_path}")
+    try:
+        schema_mtime_ns = schema_path.stat().st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"Schema template not found: {schema_path}")
+
+    return _merge_template(
+        str(prompt_path), prompt_mtime_ns, str(schema_path), schema_mtime_ns
+    )
+
+
+def render_prompt(template: str, incident_text: str) -> str:
+    """Substitute incident text into a loaded prompt template.
+
+    Args:
+        template: Template from load_prompt_template.
+        incident_text: Raw incident narrative text.
+
+    Returns:
+        Fully assembled prompt string.
+
+    Raises:
+        ValueError: If incident_text is empty.
+    """
+    if not incident_text or not incident_text.strip():
+        raise ValueError("incident_text must not be empty")
+
+    return template.replace("{{INCIDENT_TEXT}}", incident_text)
+
+
 def load_prompt(
     incident_text: str,
     schema_path: Path | None = None,
@@ -15,6 +89,9 @@ def load_prompt(
 ) -> str:
     """Assemble a complete LLM prompt from template, schema, and incident text.
 
+    Thin wrapper over load_prompt_template + render_prompt; the template
+    load is cached, so repeated calls only pay the text substitution.
+
     Args:
         incident_text: Raw incident narrative text.
         schema_path: Path to JSON schema template. Defaults to assets/schema/incident_schema_v2_3_template.json.
@@ -30,18 +107,6 @@ def load_prompt(
     if not incident_text or not incident_text.strip():
         raise ValueError("incident_text must not be empty")
 
-    prompt_path = prompt_path or _DEFAULT_PROMPT_PATH
-    schema_path = schema_path or _DEFAULT_SCHEMA_PATH
-
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt template not found: {prompt_path}")
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema template not found: {schema_path}")
-
-    prompt_template = prompt_path.read_text(encoding="utf-8")
-    schema_template = schema_path.read_text(encoding="utf-8")
-
-    result = prompt_template.replace("{{SCHEMA_TEMPLATE}}", schema_template)
-    result = result.replace("{{INCIDENT_TEXT}}", incident_text)
-
-    return result
+    return render_prompt(
+        load_prompt_template(schema_path, prompt_path), incident_text
+    )
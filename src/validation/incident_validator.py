@@ -1,24 +1,40 @@
 """Validation utilities for Schema v2.3 incident payloads."""
 
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import ValidationError
 
 from src.models.incident_v23 import IncidentV23
 
 
-def validate_incident_v23(payload: dict[str, Any]) -> tuple[bool, list[str]]:
-    """Validate a dict against the Schema v2.3 incident schema.
+def parse_incident_v23(
+    payload: dict[str, Any],
+) -> tuple[Optional[IncidentV23], list[str]]:
+    """Validate a dict and return the parsed model in one pass.
+
+    Callers that need the validated model (e.g. to dump it back out with
+    defaults filled in) should use this instead of validate_incident_v23
+    followed by a second model_validate — Pydantic validation of a full
+    incident is the expensive part and only needs to run once.
 
     Returns:
-        Tuple of (is_valid, list_of_error_messages).
+        Tuple of (model_or_none, list_of_error_messages).
     """
     try:
-        IncidentV23.model_validate(payload)
-        return True, []
+        return IncidentV23.model_validate(payload), []
     except ValidationError as e:
         errors = []
         for err in e.errors():
             loc = " -> ".join(str(x) for x in err["loc"])
             errors.append(f"{loc}: {err['msg']}")
-        return False, errors
+        return None, errors
+
+
+def validate_incident_v23(payload: dict[str, Any]) -> tuple[bool, list[str]]:
+    """Validate a dict against the Schema v2.3 incident schema.
+
+    Returns:
+        Tuple of (is_valid, list_of_error_messages).
+    """
+    model, errors = parse_incident_v23(payload)
+    return model is not None, errors
@@ -1,6 +1,6 @@
 
 import pytest
-from src.analytics.aggregation import calculate_fleet_metrics
+from src.analytics.aggregation import FleetAccumulator, calculate_fleet_metrics
 
 class TestAggregation:
     """Test cases for fleet-wide analytics aggregation."""
@@ -42,3 +42,29 @@ class TestAggregation:
         assert metrics["average_mitigation_coverage"] == 0.0
         assert metrics["average_overall_coverage"] == 0.25
         assert metrics["total_incidents"] == 2
+
+    def test_fleet_accumulator_matches_batch(self):
+        """Streaming accumulator produces the same output as the batch function."""
+        incidents_data = [
+            {
+                "incident_id": "1",
+                "analytics": {
+                    "coverage": {
+                        "prevention_coverage": 1.0,
+                        "mitigation_coverage": 0.5,
+                        "overall_coverage": 0.75
+                    }
+                }
+            },
+            {"incident_id": "2"},  # no analytics -> defaults to 0.0
+        ]
+
+        accumulator = FleetAccumulator()
+        for data in incidents_data:
+            accumulator.update(data)
+
+        assert accumulator.finalize() == calculate_fleet_metrics(incidents_data)
+
+    def test_fleet_accumulator_empty(self):
+        """Empty accumulator matches the batch function's empty-input output."""
+        assert FleetAccumulator().finalize() == calculate_fleet_metrics([])
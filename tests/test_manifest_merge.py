@@ -1,43 +1,39 @@
 """Tests for manifest merge/append functionality."""
-import pytest
-from datetime import datetime, timezone, timedelta
-from pathlib import Path
-import tempfile
+from datetime import datetime, timezone
 
 from src.ingestion.manifests import (
     IncidentManifestRow,
     merge_incident_manifests,
     save_incident_manifest,
     load_incident_manifest,
+    update_incident_manifest,
 )
 
+# Shared row factory: every test builds rows that differ from this baseline in
+# one or two fields, so construct without validation (model_construct) to keep
+# the fixture cost negligible. Values are already the correct types.
+_DEFAULTS = dict(
+    source="csb",
+    incident_id="test",
+    title="Test",
+    detail_url="",
+    pdf_url="https://csb.gov/test.pdf",
+    pdf_path="csb/pdfs/test.pdf",
+    downloaded=False,
+)
+
+
+def _row(**overrides) -> IncidentManifestRow:
+    return IncidentManifestRow.model_construct(**{**_DEFAULTS, **overrides})
+
 
 class TestMergeKey:
     """Test merge key logic: (source, pdf_url) or fallback (source, incident_id)."""
 
     def test_dedupes_by_source_and_pdf_url(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="old-id",
-                title="Old Title",
-                detail_url="",
-                pdf_url="https://csb.gov/report.pdf",
-                pdf_path="csb/pdfs/report.pdf",
-                downloaded=True,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="new-id",  # Different incident_id
-                title="New Title",
-                detail_url="",
-                pdf_url="https://csb.gov/report.pdf",  # Same pdf_url
-                pdf_path="csb/pdfs/report.pdf",
-                downloaded=False,
-            ),
-        ]
+        # Different incident_id, same pdf_url
+        existing = [_row(incident_id="old-id", title="Old Title", downloaded=True)]
+        new = [_row(incident_id="new-id", title="New Title")]
 
         merged = merge_incident_manifests(existing, new)
 
@@ -47,26 +43,12 @@ class TestMergeKey:
 
     def test_fallback_to_incident_id_when_pdf_url_empty(self):
         existing = [
-            IncidentManifestRow(
-                source="bsee",
-                incident_id="same-id",
-                title="Existing",
-                detail_url="",
-                pdf_url="",  # Empty pdf_url
-                pdf_path="bsee/pdfs/same-id.pdf",
-                downloaded=True,
-            ),
+            _row(source="bsee", incident_id="same-id", title="Existing",
+                 pdf_url="", pdf_path="bsee/pdfs/same-id.pdf", downloaded=True),
         ]
         new = [
-            IncidentManifestRow(
-                source="bsee",
-                incident_id="same-id",  # Same incident_id
-                title="New",
-                detail_url="",
-                pdf_url="",  # Empty pdf_url
-                pdf_path="bsee/pdfs/same-id.pdf",
-                downloaded=False,
-            ),
+            _row(source="bsee", incident_id="same-id", title="New",
+                 pdf_url="", pdf_path="bsee/pdfs/same-id.pdf"),
         ]
 
         merged = merge_incident_manifests(existing, new)
@@ -75,26 +57,12 @@ class TestMergeKey:
         assert merged[0].downloaded is True
 
     def test_different_sources_not_deduped(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="same-id",
-                title="CSB",
-                detail_url="",
-                pdf_url="https://example.com/report.pdf",
-                pdf_path="csb/pdfs/report.pdf",
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="bsee",  # Different source
-                incident_id="same-id",
-                title="BSEE",
-                detail_url="",
-                pdf_url="https://example.com/report.pdf",  # Same pdf_url
-                pdf_path="bsee/pdfs/report.pdf",
-            ),
-        ]
+        # Same incident_id and pdf_url, different source
+        existing = [_row(incident_id="same-id", title="CSB",
+                         pdf_url="https://example.com/report.pdf")]
+        new = [_row(source="bsee", incident_id="same-id", title="BSEE",
+                    pdf_url="https://example.com/report.pdf",
+                    pdf_path="bsee/pdfs/report.pdf")]
 
         merged = merge_incident_manifests(existing, new)
 
@@ -105,28 +73,8 @@ class TestWinnerPriority:
     """Test conflict resolution priority rules."""
 
     def test_downloaded_true_beats_false(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Existing",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=False,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="New",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-            ),
-        ]
+        existing = [_row(title="Existing")]
+        new = [_row(title="New", downloaded=True)]
 
         merged = merge_incident_manifests(existing, new)
 
@@ -136,120 +84,34 @@ class TestWinnerPriority:
         old_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
         new_time = datetime(2024, 6, 1, tzinfo=timezone.utc)
 
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Old",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-                retrieved_at=old_time,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="New",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-                retrieved_at=new_time,
-            ),
-        ]
+        existing = [_row(title="Old", downloaded=True, retrieved_at=old_time)]
+        new = [_row(title="New", downloaded=True, retrieved_at=new_time)]
 
         merged = merge_incident_manifests(existing, new)
 
         assert merged[0].retrieved_at == new_time
 
     def test_sha256_present_beats_missing(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="No Hash",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-                sha256=None,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Has Hash",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-                sha256="abc123",
-            ),
-        ]
+        existing = [_row(title="No Hash", downloaded=True, sha256=None)]
+        new = [_row(title="Has Hash", downloaded=True, sha256="abc123")]
 
         merged = merge_incident_manifests(existing, new)
 
         assert merged[0].sha256 == "abc123"
 
     def test_larger_file_size_beats_smaller(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Small",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-                sha256="abc",
-                file_size_bytes=1000,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Large",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-                sha256="def",
-                file_size_bytes=5000,
-            ),
-        ]
+        existing = [_row(title="Small", downloaded=True, sha256="abc",
+                         file_size_bytes=1000)]
+        new = [_row(title="Large", downloaded=True, sha256="def",
+                    file_size_bytes=5000)]
 
         merged = merge_incident_manifests(existing, new)
 
         assert merged[0].file_size_bytes == 5000
 
     def test_existing_wins_when_equal(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Existing",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=False,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="New",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=False,
-            ),
-        ]
+        existing = [_row(title="Existing")]
+        new = [_row(title="New")]
 
         merged = merge_incident_manifests(existing, new)
 
@@ -261,28 +123,8 @@ class TestEnrichFromLoser:
     """Test that winner is enriched with missing descriptive fields from loser."""
 
     def test_enriches_missing_title(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="",  # Empty
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Good Title",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=False,
-            ),
-        ]
+        existing = [_row(title="", downloaded=True)]
+        new = [_row(title="Good Title")]
 
         merged = merge_incident_manifests(existing, new)
 
@@ -291,32 +133,10 @@ class TestEnrichFromLoser:
         assert merged[0].title == "Good Title"
 
     def test_enriches_missing_dates(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Test",
-                date_occurred=None,
-                date_report_released=None,
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Test",
-                date_occurred="2024-01-15",
-                date_report_released="2024-06-01",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=False,
-            ),
-        ]
+        existing = [_row(date_occurred=None, date_report_released=None,
+                         downloaded=True)]
+        new = [_row(date_occurred="2024-01-15",
+                    date_report_released="2024-06-01")]
 
         merged = merge_incident_manifests(existing, new)
 
@@ -325,28 +145,9 @@ class TestEnrichFromLoser:
         assert merged[0].date_report_released == "2024-06-01"
 
     def test_does_not_overwrite_existing_descriptive_fields(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Original Title",
-                detail_url="https://original.com",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="New Title",
-                detail_url="https://new.com",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=False,
-            ),
-        ]
+        existing = [_row(title="Original Title",
+                         detail_url="https://original.com", downloaded=True)]
+        new = [_row(title="New Title", detail_url="https://new.com")]
 
         merged = merge_incident_manifests(existing, new)
 
@@ -355,32 +156,8 @@ class TestEnrichFromLoser:
         assert merged[0].detail_url == "https://original.com"
 
     def test_does_not_enrich_state_fields(self):
-        existing = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Test",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-                http_status=200,
-                sha256=None,  # Missing
-            ),
-        ]
-        new = [
-            IncidentManifestRow(
-                source="csb",
-                incident_id="test",
-                title="Test",
-                detail_url="",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=False,
-                http_status=404,
-                sha256="should-not-be-copied",
-            ),
-        ]
+        existing = [_row(downloaded=True, http_status=200, sha256=None)]
+        new = [_row(http_status=404, sha256="should-not-be-copied")]
 
         merged = merge_incident_manifests(existing, new)
 
@@ -393,50 +170,41 @@ class TestEnrichFromLoser:
 class TestMergeIntegration:
     """Integration tests with file I/O."""
 
-    def test_append_mode_preserves_existing_downloaded(self):
+    def test_append_mode_preserves_existing_downloaded(self, tmp_path):
         """Key test from requirements: append mode preserves downloaded=True."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "manifest.csv"
-
-            # Create existing manifest with downloaded=True
-            existing = [
-                IncidentManifestRow(
-                    source="csb",
-                    incident_id="test-1",
-                    title="Existing",
-                    detail_url="https://csb.gov/test",
-                    pdf_url="https://csb.gov/test.pdf",
-                    pdf_path="csb/pdfs/test.pdf",
-                    downloaded=True,
-                    http_status=200,
-                    sha256="existing-hash",
-                ),
-            ]
-            save_incident_manifest(existing, manifest_path)
-
-            # Simulate new discovery returning same pdf_url but downloaded=False
-            new = [
-                IncidentManifestRow(
-                    source="csb",
-                    incident_id="test-1",
-                    title="New Discovery",
-                    detail_url="https://csb.gov/test",
-                    pdf_url="https://csb.gov/test.pdf",
-                    pdf_path="csb/pdfs/test.pdf",
-                    downloaded=False,
-                ),
-            ]
-
-            # Load existing and merge
-            loaded = load_incident_manifest(manifest_path)
-            merged = merge_incident_manifests(loaded, new)
-
-            # Save merged
-            save_incident_manifest(merged, manifest_path)
-
-            # Reload and verify
-            final = load_incident_manifest(manifest_path)
-
-            assert len(final) == 1
-            assert final[0].downloaded is True
-            assert final[0].sha256 == "existing-hash"
+        manifest_path = tmp_path / "manifest.csv"
+
+        # Create existing manifest with downloaded=True
+        existing = [
+            _row(incident_id="test-1", title="Existing",
+                 detail_url="https://csb.gov/test", downloaded=True,
+                 http_status=200, sha256="existing-hash"),
+        ]
+        save_incident_manifest(existing, manifest_path)
+
+        # Simulate new discovery returning same pdf_url but downloaded=False
+        new = [
+            _row(incident_id="test-1", title="New Discovery",
+                 detail_url="https://csb.gov/test"),
+        ]
+
+        # Fused load -> merge -> save
+        update_incident_manifest(manifest_path, new)
+
+        # Reload and verify
+        final = load_incident_manifest(manifest_path)
+
+        assert len(final) == 1
+        assert final[0].downloaded is True
+        assert final[0].sha256 == "existing-hash"
+
+    def test_update_creates_manifest_when_missing(self, tmp_path):
+        """update_incident_manifest on a fresh path just writes the new rows."""
+        manifest_path = tmp_path / "manifest.csv"
+
+        merged = update_incident_manifest(manifest_path, [_row(downloaded=True)])
+
+        assert len(merged) == 1
+        final = load_incident_manifest(manifest_path)
+        assert len(final) == 1
+        assert final[0].downloaded is True
@@ -1,7 +1,6 @@
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
-import tempfile
 import csv
 
 from src.ingestion.manifests import (
@@ -13,6 +12,9 @@ from src.ingestion.manifests import (
     save_text_manifest,
 )
 
+# Frozen timestamp: deterministic rows, no per-test clock syscall
+_NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
 
 class TestIncidentManifestRow:
     def test_create_minimal(self):
@@ -40,7 +42,7 @@ class TestIncidentManifestRow:
             )
 
     def test_full_row(self):
-        now = datetime.now(timezone.utc)
+        now = _NOW
         row = IncidentManifestRow(
             source="bsee",
             incident_id="BSEE-2024-001",
@@ -86,7 +88,7 @@ class TestTextManifestRow:
         assert row.is_empty is False
 
     def test_full_row(self):
-        now = datetime.now(timezone.utc)
+        now = _NOW
         row = TextManifestRow(
             source="csb",
             incident_id="test",
@@ -105,7 +107,7 @@ class TestTextManifestRow:
 
 
 class TestManifestIO:
-    def test_save_and_load_incident_manifest(self):
+    def test_save_and_load_incident_manifest(self, tmp_path):
         rows = [
             IncidentManifestRow(
                 source="csb",
@@ -127,20 +129,19 @@ class TestManifestIO:
             ),
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "manifest.csv"
-            save_incident_manifest(rows, path)
+        path = tmp_path / "manifest.csv"
+        save_incident_manifest(rows, path)
 
-            assert path.exists()
+        assert path.exists()
 
-            loaded = load_incident_manifest(path)
-            assert len(loaded) == 2
-            assert loaded[0].incident_id == "test-1"
-            assert loaded[0].downloaded is True
-            assert loaded[1].source == "bsee"
+        loaded = load_incident_manifest(path)
+        assert len(loaded) == 2
+        assert loaded[0].incident_id == "test-1"
+        assert loaded[0].downloaded is True
+        assert loaded[1].source == "bsee"
 
-    def test_save_and_load_text_manifest(self):
-        now = datetime.now(timezone.utc)
+    def test_save_and_load_text_manifest(self, tmp_path):
+        now = _NOW
         rows = [
             TextManifestRow(
                 source="csb",
@@ -154,21 +155,19 @@ class TestManifestIO:
             ),
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "text_manifest.csv"
-            save_text_manifest(rows, path)
+        path = tmp_path / "text_manifest.csv"
+        save_text_manifest(rows, path)
 
-            loaded = load_text_manifest(path)
-            assert len(loaded) == 1
-            assert loaded[0].extracted is True
-            assert loaded[0].page_count == 5
+        loaded = load_text_manifest(path)
+        assert len(loaded) == 1
+        assert loaded[0].extracted is True
+        assert loaded[0].page_count == 5
 
     def test_load_nonexistent_returns_empty(self):
         result = load_incident_manifest(Path("/nonexistent/path.csv"))
         assert result == []
 
-    def test_creates_parent_dirs(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "subdir" / "nested" / "manifest.csv"
-            save_incident_manifest([], path)
-            assert path.exists()
+    def test_creates_parent_dirs(self, tmp_path):
+        path = tmp_path / "subdir" / "nested" / "manifest.csv"
+        save_incident_manifest([], path)
+        assert path.exists()
@@ -1,72 +1,55 @@
-import pytest
-from unittest.mock import patch, Mock
-from pathlib import Path
-import tempfile
+from unittest.mock import Mock
 import sys
 
-from src.pipeline import main, cmd_acquire, cmd_extract_text
+from src.pipeline import (
+    build_parser,
+    main,
+    cmd_acquire,
+    cmd_extract_text,
+    _iter_text_blocks,
+)
 
 
 class TestCliParsing:
-    def test_no_args_runs_default(self):
+    def test_no_args_runs_default(self, monkeypatch):
         """Running without args should run the original process behavior."""
-        with patch("src.pipeline.process_raw_files") as mock_process:
-            with patch("sys.argv", ["pipeline"]):
-                main()
-                mock_process.assert_called_once()
+        mock_process = Mock()
+        monkeypatch.setattr("src.pipeline.process_raw_files", mock_process)
+        monkeypatch.setattr(sys, "argv", ["pipeline"])
+        main()
+        mock_process.assert_called_once()
 
-    def test_process_subcommand(self):
+    def test_process_subcommand(self, monkeypatch):
         """'process' subcommand runs original behavior."""
-        with patch("src.pipeline.process_raw_files") as mock_process:
-            with patch("sys.argv", ["pipeline", "process"]):
-                main()
-                mock_process.assert_called_once()
+        mock_process = Mock()
+        monkeypatch.setattr("src.pipeline.process_raw_files", mock_process)
+        monkeypatch.setattr(sys, "argv", ["pipeline", "process"])
+        main()
+        mock_process.assert_called_once()
 
     def test_acquire_subcommand_parses_args(self):
         """'acquire' subcommand parses limits and flags."""
-        with patch("src.pipeline.cmd_acquire") as mock_acquire:
-            with patch(
-                "sys.argv",
-                [
-                    "pipeline",
-                    "acquire",
-                    "--csb-limit",
-                    "10",
-                    "--bsee-limit",
-                    "5",
-                    "--download",
-                ],
-            ):
-                main()
-                mock_acquire.assert_called_once()
-                args = mock_acquire.call_args[0][0]
-                assert args.csb_limit == 10
-                assert args.bsee_limit == 5
-                assert args.download is True
+        args = build_parser().parse_args(
+            ["acquire", "--csb-limit", "10", "--bsee-limit", "5", "--download"]
+        )
+        assert args.func is cmd_acquire
+        assert args.csb_limit == 10
+        assert args.bsee_limit == 5
+        assert args.download is True
 
     def test_extract_text_subcommand_parses_args(self):
         """'extract-text' subcommand parses manifest path."""
-        with patch("src.pipeline.cmd_extract_text") as mock_extract:
-            with patch(
-                "sys.argv",
-                [
-                    "pipeline",
-                    "extract-text",
-                    "--manifest",
-                    "custom/path.csv",
-                    "--out",
-                    "custom/text.csv",
-                ],
-            ):
-                main()
-                mock_extract.assert_called_once()
-                args = mock_extract.call_args[0][0]
-                assert args.manifest == "custom/path.csv"
-                assert args.out == "custom/text.csv"
+        args = build_parser().parse_args(
+            ["extract-text", "--manifest", "custom/path.csv",
+             "--out", "custom/text.csv"]
+        )
+        assert args.func is cmd_extract_text
+        assert args.manifest == "custom/path.csv"
+        assert args.out == "custom/text.csv"
 
 
 class TestCmdAcquire:
-    def test_acquire_discovers_and_saves(self):
+    def test_acquire_discovers_and_saves(self, tmp_path, monkeypatch):
         """acquire command discovers incidents and saves manifest."""
         from src.ingestion.manifests import IncidentManifestRow
 
@@ -79,26 +62,28 @@ class TestCmdAcquire:
             pdf_path="csb/pdfs/test.pdf",
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = Path(tmpdir) / "manifest.csv"
+        out_path = tmp_path / "manifest.csv"
 
-            mock_args = Mock()
-            mock_args.csb_limit = 1
-            mock_args.bsee_limit = 0
-            mock_args.out = str(out_path)
-            mock_args.download = False
-            mock_args.timeout = 30
-            mock_args.append = False
+        mock_args = Mock()
+        mock_args.csb_limit = 1
+        mock_args.bsee_limit = 0
+        mock_args.out = str(out_path)
+        mock_args.download = False
+        mock_args.timeout = 30
+        mock_args.append = False
 
-            with patch(
-                "src.pipeline.discover_csb_incidents", return_value=iter([mock_row])
-            ):
-                with patch("src.pipeline.discover_bsee_incidents", return_value=iter([])):
-                    cmd_acquire(mock_args)
+        monkeypatch.setattr(
+            "src.pipeline.discover_csb_incidents",
+            Mock(return_value=iter([mock_row])),
+        )
+        monkeypatch.setattr(
+            "src.pipeline.discover_bsee_incidents", Mock(return_value=iter([]))
+        )
+        cmd_acquire(mock_args)
 
-            assert out_path.exists()
+        assert out_path.exists()
 
-    def test_acquire_append_preserves_downloaded(self):
+    def test_acquire_append_preserves_downloaded(self, tmp_path, monkeypatch):
         """--append mode preserves existing downloaded=True row."""
         from src.ingestion.manifests import (
             IncidentManifestRow,
@@ -106,55 +91,57 @@ class TestCmdAcquire:
             load_incident_manifest,
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = Path(tmpdir) / "manifest.csv"
+        out_path = tmp_path / "manifest.csv"
 
-            # Create existing manifest with downloaded=True
-            existing_row = IncidentManifestRow(
-                source="csb",
-                incident_id="test-1",
-                title="Existing",
-                detail_url="https://csb.gov/test",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=True,
-                http_status=200,
-                sha256="existing-hash",
-            )
-            save_incident_manifest([existing_row], out_path)
+        # Create existing manifest with downloaded=True
+        existing_row = IncidentManifestRow(
+            source="csb",
+            incident_id="test-1",
+            title="Existing",
+            detail_url="https://csb.gov/test",
+            pdf_url="https://csb.gov/test.pdf",
+            pdf_path="csb/pdfs/test.pdf",
+            downloaded=True,
+            http_status=200,
+            sha256="existing-hash",
+        )
+        save_incident_manifest([existing_row], out_path)
 
-            # New discovery returns same pdf_url but downloaded=False
-            new_row = IncidentManifestRow(
-                source="csb",
-                incident_id="test-1",
-                title="New Discovery",
-                detail_url="https://csb.gov/test",
-                pdf_url="https://csb.gov/test.pdf",
-                pdf_path="csb/pdfs/test.pdf",
-                downloaded=False,
-            )
+        # New discovery returns same pdf_url but downloaded=False
+        new_row = IncidentManifestRow(
+            source="csb",
+            incident_id="test-1",
+            title="New Discovery",
+            detail_url="https://csb.gov/test",
+            pdf_url="https://csb.gov/test.pdf",
+            pdf_path="csb/pdfs/test.pdf",
+            downloaded=False,
+        )
+
+        mock_args = Mock()
+        mock_args.csb_limit = 1
+        mock_args.bsee_limit = 0
+        mock_args.out = str(out_path)
+        mock_args.download = False
+        mock_args.timeout = 30
+        mock_args.append = True
+
+        monkeypatch.setattr(
+            "src.pipeline.discover_csb_incidents",
+            Mock(return_value=iter([new_row])),
+        )
+        monkeypatch.setattr(
+            "src.pipeline.discover_bsee_incidents", Mock(return_value=iter([]))
+        )
+        cmd_acquire(mock_args)
+
+        # Verify: still exactly 1 row, still downloaded=True
+        final = load_incident_manifest(out_path)
+        assert len(final) == 1
+        assert final[0].downloaded is True
+        assert final[0].sha256 == "existing-hash"
 
-            mock_args = Mock()
-            mock_args.csb_limit = 1
-            mock_args.bsee_limit = 0
-            mock_args.out = str(out_path)
-            mock_args.download = False
-            mock_args.timeout = 30
-            mock_args.append = True
-
-            with patch(
-                "src.pipeline.discover_csb_incidents", return_value=iter([new_row])
-            ):
-                with patch("src.pipeline.discover_bsee_incidents", return_value=iter([])):
-                    cmd_acquire(mock_args)
-
-            # Verify: still exactly 1 row, still downloaded=True
-            final = load_incident_manifest(out_path)
-            assert len(final) == 1
-            assert final[0].downloaded is True
-            assert final[0].sha256 == "existing-hash"
-
-    def test_acquire_append_adds_new_incidents(self):
+    def test_acquire_append_adds_new_incidents(self, tmp_path, monkeypatch):
         """--append mode adds new incidents to existing manifest."""
         from src.ingestion.manifests import (
             IncidentManifestRow,
@@ -162,53 +149,55 @@ class TestCmdAcquire:
             load_incident_manifest,
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out_path = Path(tmpdir) / "manifest.csv"
+        out_path = tmp_path / "manifest.csv"
 
-            # Create existing manifest
-            existing_row = IncidentManifestRow(
-                source="csb",
-                incident_id="existing-1",
-                title="Existing",
-                detail_url="",
-                pdf_url="https://csb.gov/existing.pdf",
-                pdf_path="csb/pdfs/existing.pdf",
-                downloaded=True,
-            )
-            save_incident_manifest([existing_row], out_path)
-
-            # New discovery returns different incident
-            new_row = IncidentManifestRow(
-                source="csb",
-                incident_id="new-1",
-                title="New",
-                detail_url="",
-                pdf_url="https://csb.gov/new.pdf",
-                pdf_path="csb/pdfs/new.pdf",
-                downloaded=False,
-            )
+        # Create existing manifest
+        existing_row = IncidentManifestRow(
+            source="csb",
+            incident_id="existing-1",
+            title="Existing",
+            detail_url="",
+            pdf_url="https://csb.gov/existing.pdf",
+            pdf_path="csb/pdfs/existing.pdf",
+            downloaded=True,
+        )
+        save_incident_manifest([existing_row], out_path)
 
-            mock_args = Mock()
-            mock_args.csb_limit = 1
-            mock_args.bsee_limit = 0
-            mock_args.out = str(out_path)
-            mock_args.download = False
-            mock_args.timeout = 30
-            mock_args.append = True
+        # New discovery returns different incident
+        new_row = IncidentManifestRow(
+            source="csb",
+            incident_id="new-1",
+            title="New",
+            detail_url="",
+            pdf_url="https://csb.gov/new.pdf",
+            pdf_path="csb/pdfs/new.pdf",
+            downloaded=False,
+        )
 
-            with patch(
-                "src.pipeline.discover_csb_incidents", return_value=iter([new_row])
-            ):
-                with patch("src.pipeline.discover_bsee_incidents", return_value=iter([])):
-                    cmd_acquire(mock_args)
+        mock_args = Mock()
+        mock_args.csb_limit = 1
+        mock_args.bsee_limit = 0
+        mock_args.out = str(out_path)
+        mock_args.download = False
+        mock_args.timeout = 30
+        mock_args.append = True
+
+        monkeypatch.setattr(
+            "src.pipeline.discover_csb_incidents",
+            Mock(return_value=iter([new_row])),
+        )
+        monkeypatch.setattr(
+            "src.pipeline.discover_bsee_incidents", Mock(return_value=iter([]))
+        )
+        cmd_acquire(mock_args)
 
-            # Verify: now has 2 rows
-            final = load_incident_manifest(out_path)
-            assert len(final) == 2
+        # Verify: now has 2 rows
+        final = load_incident_manifest(out_path)
+        assert len(final) == 2
 
 
 class TestCmdExtractText:
-    def test_extract_text_processes_manifest(self):
+    def test_extract_text_processes_manifest(self, tmp_path, monkeypatch):
         """extract-text command reads manifest and extracts."""
         from src.ingestion.manifests import (
             IncidentManifestRow,
@@ -216,39 +205,63 @@ class TestCmdExtractText:
             save_incident_manifest,
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "incidents.csv"
-            out_path = Path(tmpdir) / "text.csv"
-
-            # Create a manifest with one downloaded row
-            rows = [
-                IncidentManifestRow(
-                    source="csb",
-                    incident_id="test-1",
-                    title="Test",
-                    detail_url="",
-                    pdf_url="",
-                    pdf_path="csb/pdfs/test.pdf",
-                    downloaded=True,
-                )
-            ]
-            save_incident_manifest(rows, manifest_path)
-
-            mock_args = Mock()
-            mock_args.manifest = str(manifest_path)
-            mock_args.out = str(out_path)
-
-            mock_text_row = TextManifestRow(
+        manifest_path = tmp_path / "incidents.csv"
+        out_path = tmp_path / "text.csv"
+
+        # Create a manifest with one downloaded row
+        rows = [
+            IncidentManifestRow(
                 source="csb",
                 incident_id="test-1",
+                title="Test",
+                detail_url="",
+                pdf_url="",
                 pdf_path="csb/pdfs/test.pdf",
-                text_path="csb/text/test.txt",
-                extracted=True,
+                downloaded=True,
             )
+        ]
+        save_incident_manifest(rows, manifest_path)
+
+        mock_args = Mock()
+        mock_args.manifest = str(manifest_path)
+        mock_args.out = str(out_path)
+
+        mock_text_row = TextManifestRow(
+            source="csb",
+            incident_id="test-1",
+            pdf_path="csb/pdfs/test.pdf",
+            text_path="csb/text/test.txt",
+            extracted=True,
+        )
+
+        monkeypatch.setattr(
+            "src.pipeline.process_incident_manifest",
+            Mock(return_value=[mock_text_row]),
+        )
+        cmd_extract_text(mock_args)
+
+        assert out_path.exists()
+
+
+class TestIterTextBlocks:
+    def test_splits_lf_blocks(self, tmp_path):
+        path = tmp_path / "lf.txt"
+        path.write_bytes(b"ID: a\nTitle: A\n\nID: b\nTitle: B\n")
+        blocks = list(_iter_text_blocks(path))
+        assert len(blocks) == 2
+        assert blocks[0] == "ID: a\nTitle: A"
+
+    def test_splits_crlf_blocks(self, tmp_path):
+        """CRLF files must split per block, with line endings normalized."""
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"ID: a\r\nTitle: A\r\n\r\nID: b\r\nTitle: B\r\n")
+        blocks = list(_iter_text_blocks(path))
+        assert len(blocks) == 2
+        assert blocks[0] == "ID: a\nTitle: A"
+        assert "\r" not in blocks[1]
 
-            with patch(
-                "src.pipeline.process_incident_manifest", return_value=[mock_text_row]
-            ):
-                cmd_extract_text(mock_args)
+    def test_empty_file_yields_nothing(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert list(_iter_text_blocks(path)) == []
 
-            assert out_path.exists()
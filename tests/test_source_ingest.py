@@ -97,7 +97,6 @@ class TestPdfTextExtraction:
         )
         assert error is None
         assert page_count == 1
-        assert "hello" in text
         assert char_count > 0
         assert text_path.exists()
         assert "hello" in text_path.read_text()
@@ -151,6 +151,26 @@ class TestDiscoverCsbIncidents:
             assert "data-quality" not in ids
             assert "investigations" not in ids
 
+    def test_failed_detail_fetch_frees_budget(self):
+        """A detail fetch that errors must not consume the discovery budget.
+
+        With limit=1 and the first detail page 404ing, the second candidate
+        on the same listing page should still be fetched and yielded.
+        """
+        with patch("src.ingestion.sources.csb.requests") as mock_requests:
+            mock_session = Mock(headers={})
+            mock_requests.Session.return_value = mock_session
+            mock_session.get.side_effect = [
+                Mock(status_code=200, text=_LISTING_HTML),  # listing page 1
+                Mock(status_code=404, text=""),             # detail for acme fails
+                Mock(status_code=200, text=_DETAIL_HTML),   # detail for beta
+            ]
+
+            rows = list(discover_csb_incidents(limit=1))
+
+            assert len(rows) == 1
+            assert rows[0].incident_id == "beta-chemical-release-"
+
     def test_incident_id_from_slug_not_title(self):
         """incident_id must come from URL slug, not _slugify(title)."""
         with patch("src.ingestion.sources.csb.requests") as mock_requests: